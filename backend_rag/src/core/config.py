@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -16,6 +18,8 @@ class Settings(BaseSettings):
     qdrant_url: str = Field(default="http://qdrant:6333")
     qdrant_api_key: str | None = Field(default=None)
     qdrant_timeout_seconds: float = Field(default=30.0)
+    qdrant_prefer_grpc: bool = Field(default=True)
+    qdrant_grpc_port: int = Field(default=6334)
 
     inference_api_url: str = Field(default="http://backend-inference:8010/v1")
     inference_timeout_seconds: float = Field(default=300.0)
@@ -27,6 +31,7 @@ class Settings(BaseSettings):
     rag_reranked_checkpoint_path: str = Field(default="./data/rag_reranked_memory_checkpoints.db")
     rag_sessions_database_url: str = Field(default="sqlite:///./data/rag_sessions.db")
     rag_default_history_window_messages: int = Field(default=8)
+    rag_checkpoint_durability: Literal["sync", "async", "exit"] = Field(default="async")
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -54,8 +54,12 @@ class RuntimeContainer:
             url=settings.qdrant_url,
             api_key=settings.qdrant_api_key,
             timeout_seconds=settings.qdrant_timeout_seconds,
+            prefer_grpc=settings.qdrant_prefer_grpc,
+            grpc_port=settings.qdrant_grpc_port,
         )
 
+        prompt_loader = PromptLoader()
+
         hybrid_retrieval_service = HybridRetrievalService(
             session_factory=self._session_factory,
             inference_client=self._inference_client,
@@ -66,9 +70,10 @@ class RuntimeContainer:
         graph_service = RagGraphService(
             retrieval_service=hybrid_retrieval_service,
             inference_client=self._inference_client,
-            prompt_loader=PromptLoader(),
+            prompt_loader=prompt_loader,
             checkpoint_path=str(resolve_local_path(settings.rag_checkpoint_path)),
             default_history_window_messages=settings.rag_default_history_window_messages,
+            checkpoint_durability=settings.rag_checkpoint_durability,
         )
 
         self.rag_chat_service = RagChatService(
@@ -87,9 +92,10 @@ class RuntimeContainer:
         reranked_graph_service = RagRerankedGraphService(
             retrieval_service=reranked_retrieval_service,
             inference_client=self._inference_client,
-            prompt_loader=PromptLoader(),
+            prompt_loader=prompt_loader,
             checkpoint_path=str(resolve_local_path(settings.rag_reranked_checkpoint_path)),
             default_history_window_messages=settings.rag_default_history_window_messages,
+            checkpoint_durability=settings.rag_checkpoint_durability,
         )
         self.rag_reranked_chat_service = RagRerankedChatService(
             graph_service=reranked_graph_service,
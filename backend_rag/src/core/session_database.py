@@ -4,10 +4,13 @@ from pathlib import Path
 
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 import src.models.session_db  # noqa: F401
 from src.models.session_db.base import SessionStoreBase
 
+_SQLITE_MEMORY_URL = "sqlite:///:memory:"
+
 
 def resolve_sqlite_url(database_url: str) -> str:
     """Resolve sqlite URLs to absolute paths under backend-rag root."""
@@ -17,7 +20,7 @@ def resolve_sqlite_url(database_url: str) -> str:
         return database_url
 
     database_path = database_url.removeprefix(prefix)
-    if database_path.startswith("/"):
+    if database_path.startswith(("/", "file:")):
         return database_url
 
     project_root = Path(__file__).resolve().parents[2]
@@ -29,7 +32,18 @@ def resolve_sqlite_url(database_url: str) -> str:
 def build_session_store_engine(database_url: str) -> Engine:
     """Create SQLAlchemy engine for the isolated session store."""
 
-    return create_engine(resolve_sqlite_url(database_url), future=True)
+    resolved_url = resolve_sqlite_url(database_url)
+    if not resolved_url.startswith("sqlite:///") or resolved_url == _SQLITE_MEMORY_URL:
+        return create_engine(resolved_url, future=True)
+
+    return create_engine(
+        resolved_url,
+        future=True,
+        poolclass=QueuePool,
+        pool_size=5,
+        max_overflow=10,
+        connect_args={"check_same_thread": False, "timeout": 5},
+    )
 
 
 def build_session_store_factory(engine: Engine) -> sessionmaker[Session]:
@@ -3,10 +3,11 @@ from __future__ import annotations
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, Response
 
 from src.core.config import load_settings
 from src.core.exceptions import (
@@ -292,32 +293,38 @@ async def custom_redoc_ui() -> HTMLResponse:
     return HTMLResponse(content=html, status_code=redoc.status_code)
 
 
+def _error_response(status_code: int, detail: str) -> Response:
+    """Serialize an error detail body with orjson."""
+
+    return Response(content=orjson.dumps({"detail": detail}), status_code=status_code, media_type="application/json")
+
+
 @app.exception_handler(ValidationDomainError)
-async def handle_validation(_: Request, exc: ValidationDomainError) -> JSONResponse:
+async def handle_validation(_: Request, exc: ValidationDomainError) -> Response:
     """Map validation-domain errors to HTTP 400."""
 
-    return JSONResponse(status_code=400, content={"detail": str(exc)})
+    return _error_response(400, str(exc))
 
 
 @app.exception_handler(ResourceNotFoundError)
-async def handle_not_found(_: Request, exc: ResourceNotFoundError) -> JSONResponse:
+async def handle_not_found(_: Request, exc: ResourceNotFoundError) -> Response:
     """Map missing-resource domain errors to HTTP 404."""
 
-    return JSONResponse(status_code=404, content={"detail": str(exc)})
+    return _error_response(404, str(exc))
 
 
 @app.exception_handler(ExternalServiceError)
-async def handle_external(_: Request, exc: ExternalServiceError) -> JSONResponse:
+async def handle_external(_: Request, exc: ExternalServiceError) -> Response:
     """Map external-service failures to HTTP 502."""
 
-    return JSONResponse(status_code=502, content={"detail": str(exc)})
+    return _error_response(502, str(exc))
 
 
 @app.exception_handler(DomainError)
-async def handle_domain(_: Request, exc: DomainError) -> JSONResponse:
+async def handle_domain(_: Request, exc: DomainError) -> Response:
     """Map uncategorized domain errors to HTTP 400."""
 
-    return JSONResponse(status_code=400, content={"detail": str(exc)})
+    return _error_response(400, str(exc))
 
 
 app.include_router(health_router, prefix="/v1")
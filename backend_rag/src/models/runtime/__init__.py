@@ -6,6 +6,7 @@ from src.models.runtime.retrieval import (
     RetrievalChunkCandidate,
     RetrievedSourceDocument,
 )
+from src.models.runtime.session import SessionTurnInput
 
 __all__ = [
     "RagGraphState",
@@ -14,4 +15,5 @@ __all__ = [
     "RankedSourceChunk",
     "RetrievedSourceDocument",
     "HybridRetrieveResult",
+    "SessionTurnInput",
 ]
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class SessionTurnInput[ResponseT]:
+    """One user/assistant exchange to append to a persisted session, with the response to snapshot."""
+
+    user_message: str
+    assistant_message: str
+    selected_document_ids: list[str] | None
+    latest_response: ResponseT
@@ -4,12 +4,12 @@ import sqlite3
 import threading
 from collections.abc import Iterator
 from typing import Annotated, Any
-from xml.sax.saxutils import escape
 
 from langchain_core.messages import AIMessage, AnyMessage, HumanMessage, SystemMessage
 from langgraph.checkpoint.sqlite import SqliteSaver
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.message import add_messages
+from langgraph.types import Durability
 from typing_extensions import TypedDict
 
 from src.reranked.retrieval_service import RerankedRetrievalService
@@ -17,6 +17,25 @@ from src.reranked.runtime import RerankedRetrieveInput
 from src.tools.inference_api_client import InferenceApiClient
 from src.tools.prompt_loader import PromptLoader
 
+_XML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+_SOURCE_TEMPLATE = (
+    "  <source id=\"{source_id}\" document_id=\"{document_id}\" "
+    "document_name=\"{document_name}\" chunk_index=\"{chunk_index}\">\n"
+    "    <context_header>{context_header}</context_header>\n"
+    "    <chunk_text>{text}</chunk_text>\n"
+    "  </source>"
+)
+_SOURCE_FIELDS = ("source_id", "document_id", "document_name", "chunk_index", "context_header", "text")
+
+
+def _render_source(source: dict[str, Any]) -> str:
+    """Render one retrieved source as an escaped XML block."""
+
+    return _SOURCE_TEMPLATE.format_map(
+        {field: str(source.get(field, "")).translate(_XML_ESCAPE_TABLE) for field in _SOURCE_FIELDS}
+    )
+
 
 class RagRerankedGraphState(TypedDict, total=False):
     """LangGraph state for hybrid+rereank request execution."""
@@ -57,10 +76,12 @@ class RagRerankedGraphService:
         prompt_loader: PromptLoader,
         checkpoint_path: str,
         default_history_window_messages: int,
+        checkpoint_durability: Durability = "async",
     ) -> None:
         self._retrieval_service = retrieval_service
         self._inference_client = inference_client
         self._default_history_window_messages = max(default_history_window_messages, 0)
+        self._checkpoint_durability: Durability = checkpoint_durability
 
         self._system_prompt = prompt_loader.load("hybrid_rag_system.md")
         self._user_prompt_template = prompt_loader.load("hybrid_rag_user.md")
@@ -93,6 +114,7 @@ class RagRerankedGraphService:
             response = self._session_graph.invoke(
                 state,
                 config={"configurable": {"thread_id": thread_id}},
+                durability=self._checkpoint_durability,
             )
 
         return response  # type: ignore[return-value]
@@ -388,26 +410,4 @@ class RagRerankedGraphService:
         if not sources:
             return "<source_set empty=\"true\" />"
 
-        blocks: list[str] = ["<source_set>"]
-        for source in sources:
-            source_id = escape(str(source.get("source_id", "")))
-            document_id = escape(str(source.get("document_id", "")))
-            document_name = escape(str(source.get("document_name", "")))
-            chunk_index = escape(str(source.get("chunk_index", "")))
-            context_header = escape(str(source.get("context_header", "")))
-            chunk_text = escape(str(source.get("text", "")))
-
-            blocks.extend(
-                [
-                    (
-                        f"  <source id=\"{source_id}\" document_id=\"{document_id}\" "
-                        f"document_name=\"{document_name}\" chunk_index=\"{chunk_index}\">"
-                    ),
-                    f"    <context_header>{context_header}</context_header>",
-                    f"    <chunk_text>{chunk_text}</chunk_text>",
-                    "  </source>",
-                ]
-            )
-
-        blocks.append("</source_set>")
-        return "\n".join(blocks)
+        return "\n".join(["<source_set>", *map(_render_source, sources), "</source_set>"])
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from collections import defaultdict
 
+import numpy as np
+
 from src.models.runtime.retrieval import HybridRetrieveInput, RetrievedSourceDocument
 from src.reranked.runtime import RerankedRetrieveInput, RerankedRetrieveResult, RerankedSourceChunk
 from src.services.hybrid_retrieval_service import HybridRetrievalService
@@ -54,7 +56,8 @@ class RerankedRetrievalService:
 
         final_sources: list[RerankedSourceChunk] = []
         consumed_indexes: set[int] = set()
-        for candidate_index, rerank_score in rerank_rows:
+        ranked_rows = rerank_rows[np.argsort(-rerank_rows["score"], kind="stable")]
+        for candidate_index, rerank_score in ranked_rows.tolist():
             if candidate_index < 0 or candidate_index >= len(hybrid_candidates):
                 continue
             if candidate_index in consumed_indexes:
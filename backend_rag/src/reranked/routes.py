@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 from collections.abc import Iterator
 from typing import Annotated
 
+import orjson
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 
@@ -19,10 +19,10 @@ from src.reranked.models import (
 router = APIRouter(prefix="/rag/reranked", tags=["RAG - Re-ranked"])
 
 
-def _sse_event(event_name: str, payload: dict[str, object]) -> str:
-    """Format one SSE event chunk."""
+def _sse_event(event_name: str, payload: dict[str, object]) -> bytes:
+    """Format one SSE event chunk as UTF-8 bytes ready for the socket."""
 
-    return f"event: {event_name}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+    return b"event: " + event_name.encode() + b"\ndata: " + orjson.dumps(payload) + b"\n\n"
 
 
 @router.get("/status")
@@ -65,7 +65,7 @@ def rag_reranked_chat_stateless_stream(
 ) -> StreamingResponse:
     """Run one-shot hybrid+rereank chat and return SSE transport stream."""
 
-    def event_stream() -> Iterator[str]:
+    def event_stream() -> Iterator[bytes]:
         try:
             for event_name, payload in service.stream_chat_stateless(data):
                 yield _sse_event(event_name, payload)
@@ -92,7 +92,7 @@ def rag_reranked_chat_session_stream(
 ) -> StreamingResponse:
     """Run session-memory hybrid+rereank chat and return SSE transport stream."""
 
-    def event_stream() -> Iterator[str]:
+    def event_stream() -> Iterator[bytes]:
         try:
             for event_name, payload in service.stream_chat_session(data):
                 yield _sse_event(event_name, payload)
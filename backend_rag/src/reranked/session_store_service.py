@@ -9,6 +9,7 @@ from sqlalchemy import Select, select
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.core.exceptions import ResourceNotFoundError, ValidationDomainError
+from src.models.runtime.session import SessionTurnInput
 from src.models.session_db.rag_reranked_session import RagRerankedSessionORM
 from src.reranked.models import (
     RagRerankedChatResponse,
@@ -154,6 +155,31 @@ class RagRerankedSessionStoreService:
     ) -> RagRerankedSessionRecord:
         """Append one user/assistant turn and snapshot the latest reranked response."""
 
+        return self.batch_append_turns(
+            session_id=session_id,
+            project_id=project_id,
+            turns=[
+                SessionTurnInput[RagRerankedChatResponse](
+                    user_message=user_message,
+                    assistant_message=assistant_message,
+                    selected_document_ids=selected_document_ids,
+                    latest_response=latest_response,
+                )
+            ],
+        )
+
+    def batch_append_turns(
+        self,
+        *,
+        session_id: str,
+        project_id: str,
+        turns: list[SessionTurnInput[RagRerankedChatResponse]],
+    ) -> RagRerankedSessionRecord:
+        """Append several turns in order within a single commit; the last turn sets the snapshot."""
+
+        if not turns:
+            raise ValidationDomainError("At least one turn is required")
+
         resolved_id = self._normalize_session_id(session_id)
         resolved_project_id = self._normalize_project_id(project_id)
         now = datetime.now(timezone.utc)
@@ -167,7 +193,7 @@ class RagRerankedSessionStoreService:
                     title="Untitled Session",
                     message_count=0,
                     messages=[],
-                    selected_document_ids=selected_document_ids or [],
+                    selected_document_ids=turns[0].selected_document_ids or [],
                     selected_source_id=None,
                     latest_response=None,
                     created_at=now,
@@ -176,20 +202,24 @@ class RagRerankedSessionStoreService:
                 db.add(row)
 
             messages = self._load_message_models(row)
-            user_content = user_message.strip()
-            if user_content:
-                messages.append(self._build_message(role="user", content=user_content, created_at=now))
+            for turn in turns:
+                user_content = turn.user_message.strip()
+                if user_content:
+                    messages.append(self._build_message(role="user", content=user_content, created_at=now))
 
-            assistant_content = assistant_message.strip()
-            if assistant_content:
-                messages.append(self._build_message(role="assistant", content=assistant_content, created_at=now))
+                assistant_content = turn.assistant_message.strip()
+                if assistant_content:
+                    messages.append(self._build_message(role="assistant", content=assistant_content, created_at=now))
 
+            latest_turn = turns[-1]
             row.project_id = resolved_project_id
             row.messages = [message.model_dump(mode="json") for message in messages]
             row.message_count = len(messages)
-            row.selected_document_ids = selected_document_ids or []
-            row.latest_response = latest_response.model_dump(mode="json")
-            row.selected_source_id = latest_response.sources[0].source_id if latest_response.sources else None
+            row.selected_document_ids = latest_turn.selected_document_ids or []
+            row.latest_response = latest_turn.latest_response.model_dump(mode="json")
+            row.selected_source_id = (
+                latest_turn.latest_response.sources[0].source_id if latest_turn.latest_response.sources else None
+            )
             if self._title_is_default(row.title):
                 row.title = self._normalize_title(None, messages=messages)
             row.updated_at = now
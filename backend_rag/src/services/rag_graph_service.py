@@ -4,11 +4,11 @@ import sqlite3
 import threading
 from collections.abc import Iterator
 from typing import Any
-from xml.sax.saxutils import escape
 
 from langchain_core.messages import AIMessage, AnyMessage, HumanMessage, SystemMessage
 from langgraph.checkpoint.sqlite import SqliteSaver
 from langgraph.graph import END, START, StateGraph
+from langgraph.types import Durability
 
 from src.models.runtime.graph import RagGraphState
 from src.models.runtime.retrieval import HybridRetrieveInput
@@ -16,6 +16,25 @@ from src.services.hybrid_retrieval_service import HybridRetrievalService
 from src.tools.inference_api_client import InferenceApiClient
 from src.tools.prompt_loader import PromptLoader
 
+_XML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+_SOURCE_TEMPLATE = (
+    "  <source id=\"{source_id}\" document_id=\"{document_id}\" "
+    "document_name=\"{document_name}\" chunk_index=\"{chunk_index}\">\n"
+    "    <context_header>{context_header}</context_header>\n"
+    "    <chunk_text>{text}</chunk_text>\n"
+    "  </source>"
+)
+_SOURCE_FIELDS = ("source_id", "document_id", "document_name", "chunk_index", "context_header", "text")
+
+
+def _render_source(source: dict[str, Any]) -> str:
+    """Render one retrieved source as an escaped XML block."""
+
+    return _SOURCE_TEMPLATE.format_map(
+        {field: str(source.get(field, "")).translate(_XML_ESCAPE_TABLE) for field in _SOURCE_FIELDS}
+    )
+
 
 class RagGraphService:
     """LangGraph orchestrator for hybrid retrieval + grounded answer generation."""
@@ -27,10 +46,12 @@ class RagGraphService:
         prompt_loader: PromptLoader,
         checkpoint_path: str,
         default_history_window_messages: int,
+        checkpoint_durability: Durability = "async",
     ) -> None:
         self._retrieval_service = retrieval_service
         self._inference_client = inference_client
         self._default_history_window_messages = max(default_history_window_messages, 0)
+        self._checkpoint_durability: Durability = checkpoint_durability
 
         self._system_prompt = prompt_loader.load("hybrid_rag_system.md")
         self._user_prompt_template = prompt_loader.load("hybrid_rag_user.md")
@@ -63,6 +84,7 @@ class RagGraphService:
             response = self._session_graph.invoke(
                 state,
                 config={"configurable": {"thread_id": thread_id}},
+                durability=self._checkpoint_durability,
             )
 
         return response  # type: ignore[return-value]
@@ -333,26 +355,4 @@ class RagGraphService:
         if not sources:
             return "<source_set empty=\"true\" />"
 
-        blocks: list[str] = ["<source_set>"]
-        for source in sources:
-            source_id = escape(str(source.get("source_id", "")))
-            document_id = escape(str(source.get("document_id", "")))
-            document_name = escape(str(source.get("document_name", "")))
-            chunk_index = escape(str(source.get("chunk_index", "")))
-            context_header = escape(str(source.get("context_header", "")))
-            chunk_text = escape(str(source.get("text", "")))
-
-            blocks.extend(
-                [
-                    (
-                        f"  <source id=\"{source_id}\" document_id=\"{document_id}\" "
-                        f"document_name=\"{document_name}\" chunk_index=\"{chunk_index}\">"
-                    ),
-                    f"    <context_header>{context_header}</context_header>",
-                    f"    <chunk_text>{chunk_text}</chunk_text>",
-                    "  </source>",
-                ]
-            )
-
-        blocks.append("</source_set>")
-        return "\n".join(blocks)
+        return "\n".join(["<source_set>", *map(_render_source, sources), "</source_set>"])
@@ -1,70 +1,97 @@
 from __future__ import annotations
 
-import json
+import socket
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TypedDict
 
 import httpx
+import numpy as np
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from src.core.exceptions import ExternalServiceError
 
+_EMBED_MAX_PARALLEL_BATCHES = 8
+_STREAM_COALESCE_MAX_PIECES = 8
+_HTTP_LIMITS = httpx.Limits(max_connections=128, max_keepalive_connections=64, keepalive_expiry=60.0)
+_HTTP_CONNECT_RETRIES = 1
+_HTTP_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
 
-class InferenceApiClient:
-    """OpenAI-compatible inference backend adapter."""
+RERANK_ROW_DTYPE = np.dtype([("index", np.int32), ("score", np.float64)])
 
-    def __init__(self, base_url: str, timeout_seconds: float) -> None:
-        self._base_url = base_url.rstrip("/")
-        self._client = httpx.Client(timeout=timeout_seconds)
 
-    def close(self) -> None:
-        """Close shared HTTP client."""
+class _WireModel(BaseModel):
+    """Base for upstream response shapes; unknown fields are ignored."""
 
-        self._client.close()
+    model_config = ConfigDict(extra="ignore")
 
-    def embed_texts(self, model: str, texts: list[str]) -> list[list[float]]:
-        """Embed one or more texts and return vectors in the same order."""
 
-        if not texts:
-            return []
+class _EmbeddingRow(TypedDict):
+    """Validated as a plain dict: per-row model instances are the bulk of parse cost."""
 
-        payload = {
-            "model": model,
-            "input": texts,
-        }
+    embedding: list[float]
 
-        try:
-            response = self._client.post(f"{self._base_url}/embeddings", json=payload)
-            response.raise_for_status()
-        except httpx.HTTPError as error:
-            raise ExternalServiceError(
-                "Inference embeddings request failed. "
-                f"Details: {self._format_http_error(error)}"
-            ) from error
 
-        parsed = response.json()
-        data = parsed.get("data")
-        if not isinstance(data, list):
-            raise ExternalServiceError("Inference embeddings response is missing data")
+class _EmbeddingsResponse(_WireModel):
+    data: list[_EmbeddingRow]
 
-        normalized: list[list[float]] = []
-        for item in data:
-            if not isinstance(item, dict):
-                raise ExternalServiceError("Inference embeddings row is malformed")
 
-            embedding = item.get("embedding")
-            if not isinstance(embedding, list):
-                raise ExternalServiceError("Inference embeddings response contains malformed vectors")
+class _ChatMessage(_WireModel):
+    content: str | None = None
 
-            vector: list[float] = []
-            for value in embedding:
-                if isinstance(value, int | float):
-                    vector.append(float(value))
 
-            if not vector:
-                raise ExternalServiceError("Inference embeddings response contains empty vector")
+class _ChatChoice(_WireModel):
+    message: _ChatMessage
+
+
+class _ChatResponse(_WireModel):
+    choices: list[_ChatChoice] = Field(min_length=1)
+
+
+class _RerankRow(TypedDict):
+    index: int
+    relevance_score: float
+
+
+class _RerankResponse(_WireModel):
+    results: list[_RerankRow]
+
+
+class InferenceApiClient:
+    """OpenAI-compatible inference backend adapter."""
+
+    def __init__(self, base_url: str, timeout_seconds: float) -> None:
+        self._base_url = base_url.rstrip("/")
+        self._client = httpx.Client(
+            timeout=timeout_seconds,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=_HTTP_LIMITS,
+                retries=_HTTP_CONNECT_RETRIES,
+                socket_options=_HTTP_SOCKET_OPTIONS,
+            ),
+        )
+    def close(self) -> None:
+        """Close the shared HTTP client."""
 
-            normalized.append(vector)
+        self._client.close()
+
+    def embed_texts(self, model: str, texts: list[str], batch_size: int = 32) -> np.ndarray:
+        """Embed texts in concurrent sub-batches and return a (len(texts), dim) float32 matrix."""
+
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        batches = self._split_batches(texts, batch_size)
+        if len(batches) == 1:
+            return self._embed_batch(model, batches[0])
 
-        return normalized
+        with ThreadPoolExecutor(max_workers=min(len(batches), _EMBED_MAX_PARALLEL_BATCHES)) as executor:
+            batch_vectors = list(executor.map(partial(self._embed_batch, model), batches))
+
+        return self._stack_batches(batch_vectors)
 
     def complete_chat(self, model: str, messages: list[dict[str, str]]) -> str:
         """Generate a non-streamed chat completion."""
@@ -85,21 +112,13 @@ class InferenceApiClient:
                 f"Details: {self._format_http_error(error)}"
             ) from error
 
-        parsed = response.json()
-        choices = parsed.get("choices")
-        if not isinstance(choices, list) or not choices:
-            raise ExternalServiceError("Inference chat response is missing choices")
-
-        first_choice = choices[0]
-        if not isinstance(first_choice, dict):
-            raise ExternalServiceError("Inference chat response choice is malformed")
-
-        message = first_choice.get("message")
-        if not isinstance(message, dict):
-            raise ExternalServiceError("Inference chat response is missing message payload")
+        try:
+            parsed = _ChatResponse.model_validate_json(response.content)
+        except ValidationError as error:
+            raise ExternalServiceError("Inference chat response is malformed") from error
 
-        content = message.get("content")
-        if not isinstance(content, str) or not content.strip():
+        content = parsed.choices[0].message.content
+        if not content or not content.strip():
             raise ExternalServiceError("Inference chat response contains empty completion")
 
         return content.strip()
@@ -111,19 +130,14 @@ class InferenceApiClient:
         query: str,
         documents: list[str],
         top_n: int | None = None,
-    ) -> list[tuple[int, float]]:
-        """Rerank candidate documents and return (index, relevance_score) rows."""
-
-        payload: dict[str, object] = {
-            "model": model,
-            "query": query,
-            "documents": documents,
-        }
-        if top_n is not None:
-            payload["top_n"] = top_n
+    ) -> np.ndarray:
+        """Rerank candidate documents and return RERANK_ROW_DTYPE rows in backend order."""
 
         try:
-            response = self._client.post(f"{self._base_url}/rerank", json=payload)
+            response = self._client.post(
+                f"{self._base_url}/rerank",
+                json=self._rerank_payload(model, query, documents, top_n),
+            )
             response.raise_for_status()
         except httpx.HTTPError as error:
             raise ExternalServiceError(
@@ -131,63 +145,181 @@ class InferenceApiClient:
                 f"Details: {self._format_http_error(error)}"
             ) from error
 
-        parsed = response.json()
-        results = parsed.get("results")
-        if not isinstance(results, list):
-            raise ExternalServiceError("Inference rerank response is missing results")
-
-        normalized: list[tuple[int, float]] = []
-        for item in results:
-            if not isinstance(item, dict):
-                raise ExternalServiceError("Inference rerank result row is malformed")
-
-            index = item.get("index")
-            score = item.get("relevance_score")
-            if not isinstance(index, int) or not isinstance(score, int | float):
-                raise ExternalServiceError("Inference rerank result row contains invalid index/score")
-
-            normalized.append((index, float(score)))
-
-        return normalized
+        return self._parse_rerank(response.content)
 
     def stream_chat_deltas(self, model: str, messages: list[dict[str, str]]) -> Iterator[str]:
         """Generate streamed chat deltas from inference backend SSE."""
 
-        payload = {
-            "model": model,
-            "stream": True,
-            "temperature": 0.0,
-            "messages": messages,
-        }
-
         try:
             with self._client.stream(
                 "POST",
                 f"{self._base_url}/chat/completions",
-                json=payload,
+                json=self._stream_payload(model, messages),
                 headers={"Accept": "text/event-stream"},
             ) as response:
                 response.raise_for_status()
 
-                for raw_line in response.iter_lines():
-                    line = raw_line.decode("utf-8", errors="ignore") if isinstance(raw_line, bytes) else raw_line
-                    line = line.strip()
-                    if not line or not line.startswith("data:"):
-                        continue
-
-                    body = line.removeprefix("data:").strip()
-                    if body == "[DONE]":
+                pending: list[str] = []
+                finished = False
+                for lines in self._iter_sse_line_batches(response):
+                    for raw_line in lines:
+                        content = self._parse_sse_line(raw_line)
+                        if content is None:
+                            finished = True
+                            break
+                        if not content:
+                            continue
+
+                        pending.append(content)
+                        if len(pending) >= _STREAM_COALESCE_MAX_PIECES:
+                            yield "".join(pending)
+                            pending.clear()
+
+                    # A blocking read cannot time out, so flush what this read delivered before asking for more.
+                    if pending:
+                        yield "".join(pending)
+                        pending.clear()
+                    if finished:
                         break
-
-                    content = self._extract_delta_content(body)
-                    if content:
-                        yield content
         except httpx.HTTPError as error:
             raise ExternalServiceError(
                 "Inference chat stream request failed. "
                 f"Details: {self._format_http_error(error)}"
             ) from error
 
+    def _embed_batch(self, model: str, texts: list[str]) -> np.ndarray:
+        """Embed one sub-batch with a single embeddings request."""
+
+        try:
+            response = self._client.post(f"{self._base_url}/embeddings", json=self._embeddings_payload(model, texts))
+            response.raise_for_status()
+        except httpx.HTTPError as error:
+            raise ExternalServiceError(
+                "Inference embeddings request failed. "
+                f"Details: {self._format_http_error(error)}"
+            ) from error
+
+        return self._parse_embeddings(response.content, expected_count=len(texts))
+
+    def _stack_batches(self, batch_vectors: list[np.ndarray]) -> np.ndarray:
+        """Join per-batch embedding matrices in input order."""
+
+        if len(batch_vectors) == 1:
+            return batch_vectors[0]
+
+        try:
+            return np.concatenate(batch_vectors)
+        except ValueError as error:
+            raise ExternalServiceError("Inference embeddings batches returned mismatched dimensions") from error
+
+    def _split_batches(self, texts: list[str], batch_size: int) -> list[list[str]]:
+        """Slice texts into contiguous sub-batches of at most batch_size items."""
+
+        size = max(batch_size, 1)
+        return [texts[index : index + size] for index in range(0, len(texts), size)]
+
+    def _embeddings_payload(self, model: str, texts: list[str]) -> dict[str, object]:
+        """Build OpenAI-style embeddings request body."""
+
+        return {
+            "model": model,
+            "input": texts,
+        }
+
+    def _rerank_payload(
+        self,
+        model: str,
+        query: str,
+        documents: list[str],
+        top_n: int | None,
+    ) -> dict[str, object]:
+        """Build rerank request body."""
+
+        payload: dict[str, object] = {
+            "model": model,
+            "query": query,
+            "documents": documents,
+        }
+        if top_n is not None:
+            payload["top_n"] = top_n
+        return payload
+
+    def _stream_payload(self, model: str, messages: list[dict[str, str]]) -> dict[str, object]:
+        """Build streamed chat-completions request body."""
+
+        return {
+            "model": model,
+            "stream": True,
+            "temperature": 0.0,
+            "messages": messages,
+        }
+
+    def _parse_embeddings(self, content: bytes, expected_count: int) -> np.ndarray:
+        """Validate an embeddings response into one (rows, dim) float32 matrix in input order."""
+
+        try:
+            data = _EmbeddingsResponse.model_validate_json(content).data
+        except ValidationError as error:
+            raise ExternalServiceError("Inference embeddings response is malformed") from error
+
+        if len(data) != expected_count:
+            raise ExternalServiceError("Inference embeddings response does not match input count")
+
+        vectors = np.empty((expected_count, 0), dtype=np.float32)
+        for position, item in enumerate(data):
+            embedding = item["embedding"]
+            if not embedding:
+                raise ExternalServiceError("Inference embeddings response contains empty vector")
+
+            if position == 0:
+                vectors = np.empty((expected_count, len(embedding)), dtype=np.float32)
+            elif len(embedding) != vectors.shape[1]:
+                # Checked explicitly: numpy would broadcast a length-1 row across the whole dimension.
+                raise ExternalServiceError(
+                    "Inference embeddings response contains mismatched vector dimensions. "
+                    f"expected={vectors.shape[1]} got={len(embedding)}"
+                )
+
+            try:
+                vectors[position] = embedding
+            except ValueError as error:
+                raise ExternalServiceError("Inference embeddings response contains malformed vectors") from error
+
+        if not np.isfinite(vectors).all():
+            raise ExternalServiceError("Inference embeddings response contains malformed vectors")
+
+        return vectors
+
+    def _parse_rerank(self, content: bytes) -> np.ndarray:
+        """Validate a rerank response into a RERANK_ROW_DTYPE array."""
+
+        try:
+            results = _RerankResponse.model_validate_json(content).results
+        except ValidationError as error:
+            raise ExternalServiceError("Inference rerank response is malformed") from error
+
+        try:
+            return np.fromiter(
+                ((row["index"], row["relevance_score"]) for row in results),
+                dtype=RERANK_ROW_DTYPE,
+                count=len(results),
+            )
+        except (OverflowError, ValueError, TypeError) as error:
+            raise ExternalServiceError("Inference rerank response is malformed") from error
+
+    def _iter_sse_line_batches(self, response: httpx.Response) -> Iterator[list[bytes]]:
+        """Split the raw SSE byte stream into the complete lines of each read without decoding to str."""
+
+        pending = b""
+        for chunk in response.iter_bytes():
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            if lines:
+                yield lines
+
+        if pending:
+            yield [pending]
+
     def _format_http_error(self, error: httpx.HTTPError) -> str:
         """Build a concise, non-empty diagnostic for HTTP failures."""
 
@@ -212,31 +344,31 @@ class InferenceApiClient:
 
         return " | ".join(parts)
 
-    def _extract_delta_content(self, raw_payload: str) -> str:
-        """Extract assistant delta text from one OpenAI-style SSE payload."""
+    def _parse_sse_line(self, raw_line: bytes) -> str | None:
+        """Return the delta text of one SSE line, or None at the end-of-stream marker."""
 
-        try:
-            parsed = json.loads(raw_payload)
-        except json.JSONDecodeError as error:
-            raise ExternalServiceError("Inference chat stream emitted malformed JSON payload") from error
+        if raw_line[:5] != b"data:":
+            return ""
 
-        if not isinstance(parsed, dict):
-            raise ExternalServiceError("Inference chat stream emitted non-object payload")
+        body = raw_line[5:].strip()
+        if body == b"[DONE]":
+            return None
 
-        choices = parsed.get("choices")
-        if not isinstance(choices, list) or not choices:
-            return ""
+        return self._extract_delta_content(body)
 
-        first_choice = choices[0]
-        if not isinstance(first_choice, dict):
-            return ""
+    def _extract_delta_content(self, raw_payload: str | bytes) -> str:
+        """Extract assistant delta text from one OpenAI-style SSE payload."""
 
-        delta = first_choice.get("delta")
-        if not isinstance(delta, dict):
-            return ""
+        try:
+            parsed = orjson.loads(raw_payload)
+        except orjson.JSONDecodeError as error:
+            raise ExternalServiceError("Inference chat stream emitted malformed JSON payload") from error
 
-        content = delta.get("content")
-        if isinstance(content, str):
-            return content
+        try:
+            content = parsed["choices"][0]["delta"]["content"]
+        except (KeyError, IndexError, TypeError):
+            if not isinstance(parsed, dict):
+                raise ExternalServiceError("Inference chat stream emitted non-object payload") from None
+            return ""
 
-        return ""
+        return content if isinstance(content, str) else ""
@@ -11,6 +11,10 @@ class PromptLoader:
     def __init__(self, prompts_dir: Path | None = None) -> None:
         root = Path(__file__).resolve().parents[1]
         self._prompts_dir = prompts_dir or (root / "prompts")
+        self._cache: dict[str, str] = {
+            prompt_path.name: prompt_path.read_text(encoding="utf-8").strip()
+            for prompt_path in self._prompts_dir.glob("*.md")
+        }
 
     def load(self, prompt_name: str) -> str:
         """Return prompt contents for a given markdown file."""
@@ -18,8 +22,8 @@ class PromptLoader:
         if not prompt_name.endswith(".md"):
             raise ValidationDomainError("Prompt names must use .md extension")
 
-        prompt_path = self._prompts_dir / prompt_name
-        if not prompt_path.exists():
+        content = self._cache.get(prompt_name)
+        if content is None:
             raise ValidationDomainError(f"Prompt file not found: {prompt_name}")
 
-        return prompt_path.read_text(encoding="utf-8").strip()
+        return content
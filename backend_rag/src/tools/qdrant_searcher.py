@@ -1,16 +1,50 @@
 from __future__ import annotations
 
+import time
+from functools import lru_cache
+
+import numpy as np
 from qdrant_client import QdrantClient
 from qdrant_client.http import models as qdrant_models
 
 from src.core.exceptions import ExternalServiceError
 
+_COLLECTION_EXISTS_TTL_SECONDS = 60.0
+
+
+@lru_cache(maxsize=256)
+def _build_document_filter(document_ids: tuple[str, ...]) -> qdrant_models.Filter:
+    """Build (and memoize) the document-id payload filter for one id set."""
+
+    return qdrant_models.Filter(
+        must=[
+            qdrant_models.FieldCondition(
+                key="document_id",
+                match=qdrant_models.MatchAny(any=list(document_ids)),
+            )
+        ]
+    )
+
 
 class QdrantSearcher:
     """Qdrant dense search adapter."""
 
-    def __init__(self, url: str, api_key: str | None, timeout_seconds: float) -> None:
-        self._client = QdrantClient(url=url, api_key=api_key, timeout=timeout_seconds)
+    def __init__(
+        self,
+        url: str,
+        api_key: str | None,
+        timeout_seconds: float,
+        prefer_grpc: bool = True,
+        grpc_port: int = 6334,
+    ) -> None:
+        self._client = QdrantClient(
+            url=url,
+            api_key=api_key,
+            timeout=timeout_seconds,
+            prefer_grpc=prefer_grpc,
+            grpc_port=grpc_port,
+        )
+        self._exists_cache: dict[str, float] = {}
 
     def close(self) -> None:
         """Release Qdrant client resources."""
@@ -20,27 +54,17 @@ class QdrantSearcher:
     def search_chunks(
         self,
         collection_name: str,
-        query_vector: list[float],
+        query_vector: np.ndarray | list[float],
         limit: int,
         document_ids: list[str] | None,
     ) -> list[qdrant_models.ScoredPoint]:
         """Search vector neighbors with optional document filter."""
 
         try:
-            exists = self._client.collection_exists(collection_name=collection_name)
-            if not exists:
+            if not self._collection_exists(collection_name):
                 return []
 
-            query_filter: qdrant_models.Filter | None = None
-            if document_ids:
-                query_filter = qdrant_models.Filter(
-                    must=[
-                        qdrant_models.FieldCondition(
-                            key="document_id",
-                            match=qdrant_models.MatchAny(any=document_ids),
-                        )
-                    ]
-                )
+            query_filter = _build_document_filter(tuple(sorted(document_ids))) if document_ids else None
 
             response = self._client.query_points(
                 collection_name=collection_name,
@@ -51,6 +75,7 @@ class QdrantSearcher:
                 with_vectors=False,
             )
         except Exception as error:  # noqa: BLE001
+            self._exists_cache.pop(collection_name, None)
             raise ExternalServiceError(
                 f"Qdrant search failed for collection '{collection_name}': {error}"
             ) from error
@@ -61,3 +86,17 @@ class QdrantSearcher:
         if isinstance(response, list):
             return response
         return []
+
+    def _collection_exists(self, collection_name: str) -> bool:
+        """Check collection existence, caching positive answers for a short TTL."""
+
+        expires_at = self._exists_cache.get(collection_name)
+        if expires_at is not None and expires_at > time.monotonic():
+            return True
+
+        exists = self._client.collection_exists(collection_name=collection_name)
+        if exists:
+            self._exists_cache[collection_name] = time.monotonic() + _COLLECTION_EXISTS_TTL_SECONDS
+        else:
+            self._exists_cache.pop(collection_name, None)
+        return exists
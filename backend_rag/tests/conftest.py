@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.core.session_database import (
+    build_session_store_engine,
+    build_session_store_factory,
+    initialize_session_store_database,
+)
+from src.models.session_db.base import SessionStoreBase
+
+_RAMDISK_ROOT = Path("/dev/shm")
+_ramdisk_tmp_dir: str | None = None
+_previous_tmpdir_env: str | None = None
+_previous_tempfile_tempdir: str | None = None
+
+
+def pytest_configure(config: pytest.Config) -> None:  # noqa: ARG001
+    """Point tempfile and pytest tmp_path at a per-run RAM-backed directory on Linux, if one is available."""
+
+    global _ramdisk_tmp_dir, _previous_tmpdir_env, _previous_tempfile_tempdir
+
+    # os.access is also False for a missing /dev/shm, so such hosts keep the default temp directory.
+    if not sys.platform.startswith("linux") or not os.access(_RAMDISK_ROOT, os.W_OK):
+        return
+
+    try:
+        ramdisk_tmp_dir = tempfile.mkdtemp(prefix="rag-tests-", dir=_RAMDISK_ROOT)
+    except OSError:
+        return
+
+    _ramdisk_tmp_dir = ramdisk_tmp_dir
+    _previous_tmpdir_env = os.environ.get("TMPDIR")
+    _previous_tempfile_tempdir = tempfile.tempdir
+    os.environ["TMPDIR"] = ramdisk_tmp_dir
+    tempfile.tempdir = ramdisk_tmp_dir
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:  # noqa: ARG001
+    """Restore the previous temp directory settings and remove the per-run RAM-backed directory."""
+
+    global _ramdisk_tmp_dir
+
+    if _ramdisk_tmp_dir is None:
+        return
+
+    if _previous_tmpdir_env is None:
+        os.environ.pop("TMPDIR", None)
+    else:
+        os.environ["TMPDIR"] = _previous_tmpdir_env
+    tempfile.tempdir = _previous_tempfile_tempdir
+
+    shutil.rmtree(_ramdisk_tmp_dir, ignore_errors=True)
+    _ramdisk_tmp_dir = None
+
+
+@pytest.fixture(scope="session")
+def session_store_engine() -> Iterator[Engine]:
+    """Shared in-memory session-store engine; tables are created once per test session."""
+
+    engine = build_session_store_engine(f"sqlite:///file:rag_sessions_{uuid4().hex}?mode=memory&cache=shared&uri=true")
+    # The shared in-memory database lives only while a connection is open, so hold one for the session.
+    with engine.connect():
+        initialize_session_store_database(engine)
+        yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_store_factory(session_store_engine: Engine) -> Iterator[sessionmaker[Session]]:
+    """Session factory on the shared engine; all session-store rows are cleared after each test."""
+
+    yield build_session_store_factory(session_store_engine)
+
+    with session_store_engine.begin() as connection:
+        for table in reversed(SessionStoreBase.metadata.sorted_tables):
+            connection.execute(table.delete())
+
+
+@pytest.fixture(scope="session")
+def shared_prompts_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Prompt directory with the hybrid RAG prompt pair, written once per test session."""
+
+    prompts_dir = tmp_path_factory.mktemp("prompts")
+    (prompts_dir / "hybrid_rag_system.md").write_text("You are grounded.", encoding="utf-8")
+    (prompts_dir / "hybrid_rag_user.md").write_text(
+        "Question: {question}\nContext:\n{retrieved_context}",
+        encoding="utf-8",
+    )
+    return prompts_dir
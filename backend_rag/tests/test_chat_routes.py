@@ -14,6 +14,8 @@ from src.routes.rag import (
     rag_chat_stateless,
 )
 
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
 
 class FakeRagChatService:
     """Minimal service stub for route-level tests."""
@@ -47,7 +49,7 @@ class FakeRagChatService:
         project_id: str,
         query: str,
     ) -> RagHybridChatResponse:
-        source = RagSourceChunk(
+        source = RagSourceChunk.model_construct(
             rank=1,
             source_id="S1",
             chunk_key="doc-1:0",
@@ -60,15 +62,15 @@ class FakeRagChatService:
             sparse_score=0.7,
             hybrid_score=0.85,
         )
-        document = RagSourceDocument(
+        document = RagSourceDocument.model_construct(
             document_id="doc-1",
             document_name="Doc One",
             hit_count=1,
             top_rank=1,
             chunk_indices=[0],
         )
-        return RagHybridChatResponse(
-            mode=mode,  # type: ignore[arg-type]
+        return RagHybridChatResponse.model_construct(
+            mode=mode,
             session_id=session_id,
             project_id=project_id,
             query=query,
@@ -78,7 +80,7 @@ class FakeRagChatService:
             sources=[source],
             documents=[document],
             citations_used=["S1"],
-            created_at=datetime.now(timezone.utc),
+            created_at=_NOW,
         )
 
 
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import json
+
 import httpx
+import numpy as np
 import pytest
 
 from src.core.exceptions import ExternalServiceError
-from src.tools.inference_api_client import InferenceApiClient
+from src.tools.inference_api_client import RERANK_ROW_DTYPE, InferenceApiClient
 
 
 class _FakeStreamResponse:
-    def __init__(self, lines: list[str]) -> None:
+    def __init__(self, lines: list[str], read_size: int = 7) -> None:
         self._lines = lines
+        self._read_size = read_size
 
     def __enter__(self) -> "_FakeStreamResponse":
         return self
@@ -20,14 +24,16 @@ class _FakeStreamResponse:
     def raise_for_status(self) -> None:
         return None
 
-    def iter_lines(self):  # noqa: ANN201
-        for line in self._lines:
-            yield line
+    def iter_bytes(self):  # noqa: ANN201
+        raw = "".join(f"{line}\r\n\r\n" for line in self._lines).encode("utf-8")
+        for offset in range(0, len(raw), self._read_size):
+            yield raw[offset : offset + self._read_size]
 
 
 class _FakeHttpClient:
-    def __init__(self, lines: list[str]) -> None:
+    def __init__(self, lines: list[str], read_size: int = 7) -> None:
         self._lines = lines
+        self._read_size = read_size
 
     def close(self) -> None:
         return None
@@ -39,19 +45,16 @@ class _FakeHttpClient:
         json: dict[str, object],  # noqa: A002, ARG002
         headers: dict[str, str],  # noqa: ARG002
     ):
-        return _FakeStreamResponse(self._lines)
+        return _FakeStreamResponse(self._lines, self._read_size)
 
 
 class _FakePostResponse:
     def __init__(self, payload: dict[str, object]) -> None:
-        self._payload = payload
+        self.content = json.dumps(payload).encode("utf-8")
 
     def raise_for_status(self) -> None:
         return None
 
-    def json(self) -> dict[str, object]:
-        return self._payload
-
 
 class _FakeHttpClientWithPost(_FakeHttpClient):
     def __init__(self, lines: list[str], post_payload: dict[str, object]) -> None:
@@ -62,6 +65,56 @@ class _FakeHttpClientWithPost(_FakeHttpClient):
         return _FakePostResponse(self._post_payload)
 
 
+class _FakeEmbeddingsHttpClient(_FakeHttpClient):
+    def __init__(self) -> None:
+        super().__init__([])
+        self.batches: list[list[str]] = []
+
+    def post(self, url: str, json: dict[str, object]):  # noqa: ANN201, A002, ARG002
+        texts = list(json["input"])  # type: ignore[call-overload]
+        self.batches.append(texts)
+        return _FakePostResponse({"data": [{"embedding": [float(len(text)), 1.0]} for text in texts]})
+
+
+def test_embed_texts_splits_batches_and_preserves_order(monkeypatch) -> None:  # noqa: ANN001
+    http_client = _FakeEmbeddingsHttpClient()
+    monkeypatch.setattr(httpx, "Client", lambda **_: http_client)
+
+    client = InferenceApiClient(base_url="http://backend-inference:8010/v1", timeout_seconds=10.0)
+    vectors = client.embed_texts(model="bge-m3:latest", texts=["a", "bb", "ccc", "dddd", "eeeee"], batch_size=2)
+
+    assert sorted(len(batch) for batch in http_client.batches) == [1, 2, 2]
+    assert vectors.shape == (5, 2)
+    assert vectors.dtype == np.float32
+    assert vectors[:, 0].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [[{"embedding": [0.1, None, 0.3]}], [None]],
+    ids=["non-numeric-value", "null-row"],
+)
+def test_embed_texts_rejects_malformed_rows(monkeypatch, data: list[object]) -> None:  # noqa: ANN001
+    payload = {"data": data}
+    monkeypatch.setattr(httpx, "Client", lambda **_: _FakeHttpClientWithPost([], payload))
+
+    client = InferenceApiClient(base_url="http://backend-inference:8010/v1", timeout_seconds=10.0)
+
+    with pytest.raises(ExternalServiceError, match="embeddings response is malformed"):
+        client.embed_texts(model="bge-m3:latest", texts=["query"])
+
+
+@pytest.mark.parametrize("short_row", [[0.5], [0.1, 0.2]])
+def test_embed_texts_rejects_rows_with_mismatched_dimensions(monkeypatch, short_row: list[float]) -> None:  # noqa: ANN001
+    payload = {"data": [{"embedding": [0.1, 0.2, 0.3]}, {"embedding": short_row}]}
+    monkeypatch.setattr(httpx, "Client", lambda **_: _FakeHttpClientWithPost([], payload))
+
+    client = InferenceApiClient(base_url="http://backend-inference:8010/v1", timeout_seconds=10.0)
+
+    with pytest.raises(ExternalServiceError, match=f"expected=3 got={len(short_row)}"):
+        client.embed_texts(model="bge-m3:latest", texts=["first", "second"])
+
+
 def test_stream_chat_deltas_extracts_content_only(monkeypatch) -> None:  # noqa: ANN001
     lines = [
         'data: {"id":"chatcmpl-1","choices":[{"index":0,"delta":{"role":"assistant"},"finish_reason":null}]}',
@@ -74,7 +127,7 @@ def test_stream_chat_deltas_extracts_content_only(monkeypatch) -> None:  # noqa:
     monkeypatch.setattr(
         httpx,
         "Client",
-        lambda timeout: _FakeHttpClient(lines),  # noqa: ARG005
+        lambda **_: _FakeHttpClient(lines),  # noqa: ARG005
     )
 
     client = InferenceApiClient(base_url="http://backend-inference:8010/v1", timeout_seconds=10.0)
@@ -88,13 +141,64 @@ def test_stream_chat_deltas_extracts_content_only(monkeypatch) -> None:  # noqa:
     assert "".join(chunks) == "Hello world"
 
 
+def test_stream_chat_deltas_coalesces_pieces_within_one_read(monkeypatch) -> None:  # noqa: ANN001
+    lines = [f'data: {{"choices":[{{"delta":{{"content":"t{index} "}}}}]}}' for index in range(10)]
+    lines.append("data: [DONE]")
+
+    monkeypatch.setattr(httpx, "Client", lambda **_: _FakeHttpClient(lines, read_size=1 << 16))
+
+    client = InferenceApiClient(base_url="http://backend-inference:8010/v1", timeout_seconds=10.0)
+    chunks = list(client.stream_chat_deltas(model="gpt-oss:20b", messages=[{"role": "user", "content": "hello"}]))
+
+    assert chunks == ["t0 t1 t2 t3 t4 t5 t6 t7 ", "t8 t9 "]
+
+
+def test_stream_chat_deltas_flushes_before_the_next_read(monkeypatch) -> None:  # noqa: ANN001
+    lines = [f'data: {{"choices":[{{"delta":{{"content":"t{index} "}}}}]}}' for index in range(3)]
+    lines.append("data: [DONE]")
+    event_size = len(f"{lines[0]}\r\n\r\n")
+
+    monkeypatch.setattr(httpx, "Client", lambda **_: _FakeHttpClient(lines, read_size=event_size))
+
+    client = InferenceApiClient(base_url="http://backend-inference:8010/v1", timeout_seconds=10.0)
+    chunks = list(client.stream_chat_deltas(model="gpt-oss:20b", messages=[{"role": "user", "content": "hello"}]))
+
+    assert chunks == ["t0 ", "t1 ", "t2 "]
+
+
+def test_stream_chat_deltas_keeps_multibyte_text_split_across_chunks(monkeypatch) -> None:  # noqa: ANN001
+    lines = [
+        ": keep-alive",
+        'data: {"choices":[{"index":0,"delta":{"content":"Café "}}]}',
+        'data: {"choices":[{"index":0,"delta":{"content":"naïve ✓"}}]}',
+        "data: [DONE]",
+        'data: {"choices":[{"index":0,"delta":{"content":"ignored"}}]}',
+    ]
+
+    monkeypatch.setattr(
+        httpx,
+        "Client",
+        lambda **_: _FakeHttpClient(lines),  # noqa: ARG005
+    )
+
+    client = InferenceApiClient(base_url="http://backend-inference:8010/v1", timeout_seconds=10.0)
+    chunks = list(
+        client.stream_chat_deltas(
+            model="gpt-oss:20b",
+            messages=[{"role": "user", "content": "hello"}],
+        )
+    )
+
+    assert "".join(chunks) == "Café naïve ✓"
+
+
 def test_stream_chat_deltas_rejects_malformed_json(monkeypatch) -> None:  # noqa: ANN001
     lines = ["data: not-json"]
 
     monkeypatch.setattr(
         httpx,
         "Client",
-        lambda timeout: _FakeHttpClient(lines),  # noqa: ARG005
+        lambda **_: _FakeHttpClient(lines),  # noqa: ARG005
     )
 
     client = InferenceApiClient(base_url="http://backend-inference:8010/v1", timeout_seconds=10.0)
@@ -108,6 +212,33 @@ def test_stream_chat_deltas_rejects_malformed_json(monkeypatch) -> None:  # noqa
         )
 
 
+def test_stream_chat_deltas_skips_chunks_without_text_content(monkeypatch) -> None:  # noqa: ANN001
+    lines = [
+        'data: {"choices":[]}',
+        'data: {"choices":[{"finish_reason":"stop"}]}',
+        'data: {"choices":[{"delta":{"content":null}}]}',
+        'data: {"choices":"unexpected"}',
+        'data: {"choices":[{"delta":{"content":"ok"}}]}',
+        "data: [DONE]",
+    ]
+
+    monkeypatch.setattr(httpx, "Client", lambda **_: _FakeHttpClient(lines))
+
+    client = InferenceApiClient(base_url="http://backend-inference:8010/v1", timeout_seconds=10.0)
+    chunks = list(client.stream_chat_deltas(model="gpt-oss:20b", messages=[{"role": "user", "content": "hello"}]))
+
+    assert chunks == ["ok"]
+
+
+def test_stream_chat_deltas_rejects_non_object_payload(monkeypatch) -> None:  # noqa: ANN001
+    monkeypatch.setattr(httpx, "Client", lambda **_: _FakeHttpClient(["data: [1, 2]"]))
+
+    client = InferenceApiClient(base_url="http://backend-inference:8010/v1", timeout_seconds=10.0)
+
+    with pytest.raises(ExternalServiceError, match="non-object payload"):
+        list(client.stream_chat_deltas(model="gpt-oss:20b", messages=[{"role": "user", "content": "hello"}]))
+
+
 def test_rerank_returns_index_score_rows(monkeypatch) -> None:  # noqa: ANN001
     payload = {
         "model": "bge-reranker-v2-m3:latest",
@@ -120,7 +251,7 @@ def test_rerank_returns_index_score_rows(monkeypatch) -> None:  # noqa: ANN001
     monkeypatch.setattr(
         httpx,
         "Client",
-        lambda timeout: _FakeHttpClientWithPost([], payload),  # noqa: ARG005
+        lambda **_: _FakeHttpClientWithPost([], payload),  # noqa: ARG005
     )
 
     client = InferenceApiClient(base_url="http://backend-inference:8010/v1", timeout_seconds=10.0)
@@ -131,4 +262,16 @@ def test_rerank_returns_index_score_rows(monkeypatch) -> None:  # noqa: ANN001
         top_n=2,
     )
 
-    assert rows == [(1, 0.82), (0, 0.63)]
+    assert rows.dtype == RERANK_ROW_DTYPE
+    assert rows["index"].tolist() == [1, 0]
+    assert rows["score"].tolist() == [0.82, 0.63]
+
+
+def test_rerank_rejects_index_outside_row_dtype(monkeypatch) -> None:  # noqa: ANN001
+    payload = {"results": [{"index": 2**40, "relevance_score": 0.5}]}
+    monkeypatch.setattr(httpx, "Client", lambda **_: _FakeHttpClientWithPost([], payload))
+
+    client = InferenceApiClient(base_url="http://backend-inference:8010/v1", timeout_seconds=10.0)
+
+    with pytest.raises(ExternalServiceError, match="rerank response is malformed"):
+        client.rerank(model="bge-reranker-v2-m3:latest", query="q", documents=["a"])
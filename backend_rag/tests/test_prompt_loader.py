@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.core.exceptions import ValidationDomainError
+from src.tools.prompt_loader import PromptLoader
+
+
+def test_loader_preloads_prompts_at_construction(tmp_path: Path) -> None:
+    prompt_path = tmp_path / "system.md"
+    prompt_path.write_text("  First version.  \n", encoding="utf-8")
+    loader = PromptLoader(prompts_dir=tmp_path)
+
+    prompt_path.unlink()
+    (tmp_path / "late.md").write_text("Added after startup.", encoding="utf-8")
+
+    assert loader.load("system.md") == "First version."
+    with pytest.raises(ValidationDomainError, match="not found"):
+        loader.load("late.md")
+
+
+def test_load_rejects_missing_and_non_markdown_prompts(tmp_path: Path) -> None:
+    loader = PromptLoader(prompts_dir=tmp_path)
+
+    with pytest.raises(ValidationDomainError, match="not found"):
+        loader.load("missing.md")
+    with pytest.raises(ValidationDomainError, match=".md extension"):
+        loader.load("system.txt")
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pytest
+
+import src.tools.qdrant_searcher as qdrant_searcher_module
+from src.core.exceptions import ExternalServiceError
+from src.tools.qdrant_searcher import QdrantSearcher
+
+
+class _FakeQueryResponse:
+    def __init__(self) -> None:
+        self.points: list[object] = []
+
+
+class _FakeQdrantClient:
+    def __init__(self, **_: object) -> None:
+        self.exists_calls = 0
+        self.query_filters: list[object] = []
+        self.fail_next_query = False
+
+    def close(self) -> None:
+        return None
+
+    def collection_exists(self, collection_name: str) -> bool:  # noqa: ARG002
+        self.exists_calls += 1
+        return True
+
+    def query_points(self, **kwargs: object) -> _FakeQueryResponse:
+        if self.fail_next_query:
+            self.fail_next_query = False
+            raise RuntimeError("collection vanished")
+        self.query_filters.append(kwargs["query_filter"])
+        return _FakeQueryResponse()
+
+
+def _build_searcher(monkeypatch) -> tuple[QdrantSearcher, _FakeQdrantClient]:  # noqa: ANN001
+    monkeypatch.setattr(qdrant_searcher_module, "QdrantClient", _FakeQdrantClient)
+    searcher = QdrantSearcher(url="http://qdrant:6333", api_key=None, timeout_seconds=5.0)
+    return searcher, searcher._client  # type: ignore[return-value]
+
+
+def test_search_chunks_caches_collection_existence(monkeypatch) -> None:  # noqa: ANN001
+    searcher, client = _build_searcher(monkeypatch)
+
+    searcher.search_chunks("project_a", [0.1, 0.2], limit=5, document_ids=None)
+    searcher.search_chunks("project_a", [0.1, 0.2], limit=5, document_ids=None)
+
+    assert client.exists_calls == 1
+
+
+def test_search_chunks_evicts_existence_cache_after_query_failure(monkeypatch) -> None:  # noqa: ANN001
+    searcher, client = _build_searcher(monkeypatch)
+
+    searcher.search_chunks("project_a", [0.1, 0.2], limit=5, document_ids=None)
+    client.fail_next_query = True
+    with pytest.raises(ExternalServiceError, match="collection vanished"):
+        searcher.search_chunks("project_a", [0.1, 0.2], limit=5, document_ids=None)
+    searcher.search_chunks("project_a", [0.1, 0.2], limit=5, document_ids=None)
+
+    assert client.exists_calls == 2
+
+
+def test_search_chunks_reuses_filter_for_same_document_set(monkeypatch) -> None:  # noqa: ANN001
+    searcher, client = _build_searcher(monkeypatch)
+
+    searcher.search_chunks("project_a", [0.1, 0.2], limit=5, document_ids=["doc-2", "doc-1"])
+    searcher.search_chunks("project_a", [0.1, 0.2], limit=5, document_ids=["doc-1", "doc-2"])
+    searcher.search_chunks("project_a", [0.1, 0.2], limit=5, document_ids=None)
+
+    first_filter, second_filter, no_filter = client.query_filters
+    assert first_filter is second_filter
+    assert first_filter.must[0].match.any == ["doc-1", "doc-2"]  # type: ignore[union-attr]
+    assert no_filter is None
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
 
 from src.models.runtime.retrieval import (
     HybridRetrieveInput,
@@ -9,8 +9,9 @@ from src.models.runtime.retrieval import (
     RankedSourceChunk,
     RetrievedSourceDocument,
 )
-from src.services.rag_graph_service import RagGraphService
-from src.tools.prompt_loader import PromptLoader
+
+if TYPE_CHECKING:
+    from src.services.rag_graph_service import RagGraphService
 
 
 class FakeRetrievalService:
@@ -47,13 +48,13 @@ class FakeRetrievalService:
 
 
 class FakeInferenceClient:
-    """Chat completion stub that records model input messages."""
+    """Chat completion stub that records the role sequence of each model input."""
 
     def __init__(self) -> None:
-        self.calls: list[list[dict[str, str]]] = []
+        self.calls: list[list[str]] = []
 
     def complete_chat(self, model: str, messages: list[dict[str, str]]) -> str:
-        self.calls.append(messages)
+        self.calls.append([message["role"] for message in messages])
         return "Grounded answer [S1]"
 
     def stream_chat_deltas(self, model: str, messages: list[dict[str, str]]):  # noqa: ARG002, ANN201
@@ -61,11 +62,22 @@ class FakeInferenceClient:
         yield "answer [S1]"
 
 
-def _write_test_prompts(directory: Path) -> None:
-    (directory / "hybrid_rag_system.md").write_text("You are grounded.", encoding="utf-8")
-    (directory / "hybrid_rag_user.md").write_text(
-        "Question: {question}\nContext:\n{retrieved_context}",
-        encoding="utf-8",
+def _build_service(
+    prompts_dir: Path,
+    retrieval: FakeRetrievalService,
+    inference: FakeInferenceClient,
+) -> RagGraphService:
+    # Imported here so collection (and -k filtered runs) skip the langgraph import chain.
+    from src.services.rag_graph_service import RagGraphService
+    from src.tools.prompt_loader import PromptLoader
+
+    return RagGraphService(
+        retrieval_service=retrieval,  # type: ignore[arg-type]
+        inference_client=inference,  # type: ignore[arg-type]
+        prompt_loader=PromptLoader(prompts_dir=prompts_dir),
+        checkpoint_path=":memory:",
+        default_history_window_messages=8,
+        checkpoint_durability="exit",
     )
 
 
@@ -86,86 +98,81 @@ def _base_state(message: str) -> dict[str, object]:
     }
 
 
-def test_session_graph_persists_memory_between_calls() -> None:
+def test_session_graph_persists_memory_between_calls(shared_prompts_dir: Path) -> None:
     retrieval = FakeRetrievalService()
     inference = FakeInferenceClient()
 
-    with TemporaryDirectory() as tmp_dir_raw:
-        tmp_dir = Path(tmp_dir_raw)
-        prompts_dir = tmp_dir / "prompts"
-        prompts_dir.mkdir(parents=True, exist_ok=True)
-        _write_test_prompts(prompts_dir)
-
-        service = RagGraphService(
-            retrieval_service=retrieval,  # type: ignore[arg-type]
-            inference_client=inference,  # type: ignore[arg-type]
-            prompt_loader=PromptLoader(prompts_dir=prompts_dir),
-            checkpoint_path=str(tmp_dir / "rag-checkpoints.db"),
-            default_history_window_messages=8,
-        )
-        try:
-            service.invoke_session(_base_state("first question"), session_id="session-1")
-            service.invoke_session(_base_state("second question"), session_id="session-1")
-        finally:
-            service.close()
+    service = _build_service(shared_prompts_dir, retrieval, inference)
+    try:
+        service.invoke_session(_base_state("first question"), session_id="session-1")
+        service.invoke_session(_base_state("second question"), session_id="session-1")
+    finally:
+        service.close()
 
     assert len(inference.calls) == 2
-    second_call = inference.calls[1]
-    roles = [item["role"] for item in second_call]
+    roles = inference.calls[1]
     assert roles[0] == "system"
     assert "assistant" in roles[1:-1]
 
 
-def test_stateless_graph_keeps_calls_isolated() -> None:
+def test_stateless_graph_keeps_calls_isolated(shared_prompts_dir: Path) -> None:
     retrieval = FakeRetrievalService()
     inference = FakeInferenceClient()
 
-    with TemporaryDirectory() as tmp_dir_raw:
-        tmp_dir = Path(tmp_dir_raw)
-        prompts_dir = tmp_dir / "prompts"
-        prompts_dir.mkdir(parents=True, exist_ok=True)
-        _write_test_prompts(prompts_dir)
-
-        service = RagGraphService(
-            retrieval_service=retrieval,  # type: ignore[arg-type]
-            inference_client=inference,  # type: ignore[arg-type]
-            prompt_loader=PromptLoader(prompts_dir=prompts_dir),
-            checkpoint_path=str(tmp_dir / "rag-checkpoints.db"),
-            default_history_window_messages=8,
-        )
-        try:
-            service.invoke_stateless(_base_state("one"))
-            service.invoke_stateless(_base_state("two"))
-        finally:
-            service.close()
+    service = _build_service(shared_prompts_dir, retrieval, inference)
+    try:
+        service.invoke_stateless(_base_state("one"))
+        service.invoke_stateless(_base_state("two"))
+    finally:
+        service.close()
 
     assert len(inference.calls) == 2
-    second_call = inference.calls[1]
-    roles = [item["role"] for item in second_call]
+    roles = inference.calls[1]
     assert roles == ["system", "user"]
 
 
-def test_prepare_stream_stateless_accepts_raw_dict_messages() -> None:
+def test_prepare_stream_stateless_accepts_raw_dict_messages(shared_prompts_dir: Path) -> None:
     retrieval = FakeRetrievalService()
     inference = FakeInferenceClient()
 
-    with TemporaryDirectory() as tmp_dir_raw:
-        tmp_dir = Path(tmp_dir_raw)
-        prompts_dir = tmp_dir / "prompts"
-        prompts_dir.mkdir(parents=True, exist_ok=True)
-        _write_test_prompts(prompts_dir)
-
-        service = RagGraphService(
-            retrieval_service=retrieval,  # type: ignore[arg-type]
-            inference_client=inference,  # type: ignore[arg-type]
-            prompt_loader=PromptLoader(prompts_dir=prompts_dir),
-            checkpoint_path=str(tmp_dir / "rag-checkpoints.db"),
-            default_history_window_messages=8,
-        )
-        try:
-            stream_state, llm_messages = service.prepare_stream_stateless(_base_state("raw dict question"))  # type: ignore[arg-type]
-        finally:
-            service.close()
+    service = _build_service(shared_prompts_dir, retrieval, inference)
+    try:
+        stream_state, llm_messages = service.prepare_stream_stateless(_base_state("raw dict question"))  # type: ignore[arg-type]
+    finally:
+        service.close()
 
     assert stream_state["query"] == "raw dict question"
     assert "raw dict question" in llm_messages[-1]["content"]
+
+
+def test_build_retrieval_context_escapes_source_fields(shared_prompts_dir: Path) -> None:
+    retrieval = FakeRetrievalService()
+    inference = FakeInferenceClient()
+
+    service = _build_service(shared_prompts_dir, retrieval, inference)
+    try:
+        context = service._build_retrieval_context(
+            [
+                {
+                    "source_id": "S1",
+                    "document_id": "doc-1",
+                    "document_name": "A & B",
+                    "chunk_index": 0,
+                    "context_header": "<Policy>",
+                    "text": "{literal} text",
+                }
+            ]
+        )
+        empty_context = service._build_retrieval_context([])
+    finally:
+        service.close()
+
+    assert context.splitlines() == [
+        "<source_set>",
+        '  <source id="S1" document_id="doc-1" document_name="A &amp; B" chunk_index="0">',
+        "    <context_header>&lt;Policy&gt;</context_header>",
+        "    <chunk_text>{literal} text</chunk_text>",
+        "  </source>",
+        "</source_set>",
+    ]
+    assert empty_context == '<source_set empty="true" />'
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from tempfile import TemporaryDirectory
+from pathlib import Path
 
 import pytest
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from src.core.exceptions import ResourceNotFoundError
 from src.core.session_database import (
@@ -13,8 +16,11 @@ from src.core.session_database import (
 )
 from src.models.api.rag import RagHybridChatResponse
 from src.models.api.session import RagSessionCreateRequest, RagSessionMessage, RagSessionUpdateRequest
+from src.models.runtime.session import SessionTurnInput
 from src.services.rag_session_store_service import RagSessionStoreService
 
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
 
 def _build_response(session_id: str, query: str) -> RagHybridChatResponse:
     return RagHybridChatResponse(
@@ -28,98 +34,154 @@ def _build_response(session_id: str, query: str) -> RagHybridChatResponse:
         sources=[],
         documents=[],
         citations_used=[],
-        created_at=datetime.now(timezone.utc),
+        created_at=_NOW,
     )
 
 
-def _build_service(tmp_path: str) -> RagSessionStoreService:
-    engine = build_session_store_engine(f"sqlite:///{tmp_path}/rag_sessions_test.db")
-    initialize_session_store_database(engine)
-    factory = build_session_store_factory(engine)
-    return RagSessionStoreService(factory)
+@pytest.fixture
+def service(session_store_factory: sessionmaker[Session]) -> RagSessionStoreService:
+    return RagSessionStoreService(session_store_factory)
 
 
-def test_crud_and_snapshot_update_roundtrip() -> None:
-    with TemporaryDirectory() as tmp_dir:
-        service = _build_service(tmp_dir)
+def test_session_store_engine_pools_sqlite_connections(session_store_engine: Engine) -> None:
+    assert isinstance(session_store_engine.pool, QueuePool)
 
-        created = service.create_session(
-            RagSessionCreateRequest(
-                project_id="project-1",
-                selected_document_ids=["doc-1"],
-            )
-        )
-        assert created.message_count == 0
-
-        listed = service.list_sessions()
-        assert len(listed.sessions) == 1
-        assert listed.sessions[0].id == created.id
-
-        now = datetime.now(timezone.utc)
-        updated = service.update_session(
-            created.id,
-            RagSessionUpdateRequest(
-                title="Updated Session",
-                selected_source_id="S1",
-                selected_document_ids=["doc-2"],
-                latest_response=_build_response(created.id, "what changed"),
-                messages=[
-                    RagSessionMessage(
-                        id="msg-1",
-                        role="user",
-                        content="hello",
-                        created_at=now,
-                    ),
-                    RagSessionMessage(
-                        id="msg-2",
-                        role="assistant",
-                        content="hi there",
-                        created_at=now,
-                    ),
-                ],
-            ),
+
+def _assert_crud_and_snapshot_roundtrip(service: RagSessionStoreService) -> None:
+    created = service.create_session(
+        RagSessionCreateRequest(
+            project_id="project-1",
+            selected_document_ids=["doc-1"],
         )
+    )
+    assert created.message_count == 0
+
+    listed = service.list_sessions()
+    assert len(listed.sessions) == 1
+    assert listed.sessions[0].id == created.id
+
+    updated = service.update_session(
+        created.id,
+        RagSessionUpdateRequest(
+            title="Updated Session",
+            selected_source_id="S1",
+            selected_document_ids=["doc-2"],
+            latest_response=_build_response(created.id, "what changed"),
+            messages=[
+                RagSessionMessage(
+                    id="msg-1",
+                    role="user",
+                    content="hello",
+                    created_at=_NOW,
+                ),
+                RagSessionMessage(
+                    id="msg-2",
+                    role="assistant",
+                    content="hi there",
+                    created_at=_NOW,
+                ),
+            ],
+        ),
+    )
 
-        assert updated.title == "Updated Session"
-        assert updated.message_count == 2
-        assert updated.selected_document_ids == ["doc-2"]
-        assert updated.latest_response is not None
-        assert updated.latest_response.query == "what changed"
+    assert updated.title == "Updated Session"
+    assert updated.message_count == 2
+    assert updated.selected_document_ids == ["doc-2"]
+    assert updated.latest_response is not None
+    assert updated.latest_response.query == "what changed"
 
-        loaded = service.get_session(created.id)
-        assert loaded.messages[0].content == "hello"
-        assert loaded.selected_source_id == "S1"
+    loaded = service.get_session(created.id)
+    assert loaded.messages[0].content == "hello"
+    assert loaded.selected_source_id == "S1"
 
-        service.delete_session(created.id)
-        assert service.list_sessions().sessions == []
+    service.delete_session(created.id)
+    assert service.list_sessions().sessions == []
 
-        with pytest.raises(ResourceNotFoundError):
-            service.get_session(created.id)
+    with pytest.raises(ResourceNotFoundError):
+        service.get_session(created.id)
 
 
-def test_append_turn_creates_and_appends_messages() -> None:
-    with TemporaryDirectory() as tmp_dir:
-        service = _build_service(tmp_dir)
+def test_crud_and_snapshot_update_roundtrip(service: RagSessionStoreService) -> None:
+    _assert_crud_and_snapshot_roundtrip(service)
 
-        first = service.append_turn(
-            session_id="session-abc",
-            project_id="project-1",
-            user_message="first question",
-            assistant_message="first answer",
-            selected_document_ids=["doc-1"],
-            latest_response=_build_response("session-abc", "first question"),
-        )
-        second = service.append_turn(
-            session_id="session-abc",
-            project_id="project-1",
-            user_message="second question",
-            assistant_message="second answer",
-            selected_document_ids=["doc-1", "doc-2"],
-            latest_response=_build_response("session-abc", "second question"),
-        )
 
-        assert first.message_count == 2
-        assert second.message_count == 4
-        assert second.latest_response is not None
-        assert second.latest_response.query == "second question"
-        assert second.selected_document_ids == ["doc-1", "doc-2"]
+@pytest.mark.parametrize(
+    ("journal_mode", "synchronous"),
+    [("wal", "NORMAL"), ("delete", "FULL")],
+)
+def test_crud_and_snapshot_roundtrip_under_sqlite_pragmas(tmp_path: Path, journal_mode: str, synchronous: str) -> None:
+    engine = build_session_store_engine(f"sqlite:///{tmp_path}/rag_sessions_test.db")
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, _connection_record) -> None:  # noqa: ANN001
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA journal_mode={journal_mode}")
+        cursor.execute(f"PRAGMA synchronous={synchronous}")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
+    try:
+        initialize_session_store_database(engine)
+        with engine.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == journal_mode
+
+        _assert_crud_and_snapshot_roundtrip(RagSessionStoreService(build_session_store_factory(engine)))
+    finally:
+        engine.dispose()
+
+
+def test_append_turn_creates_and_appends_messages(service: RagSessionStoreService) -> None:
+    first = service.append_turn(
+        session_id="session-abc",
+        project_id="project-1",
+        user_message="first question",
+        assistant_message="first answer",
+        selected_document_ids=["doc-1"],
+        latest_response=_build_response("session-abc", "first question"),
+    )
+    second = service.append_turn(
+        session_id="session-abc",
+        project_id="project-1",
+        user_message="second question",
+        assistant_message="second answer",
+        selected_document_ids=["doc-1", "doc-2"],
+        latest_response=_build_response("session-abc", "second question"),
+    )
+
+    assert first.message_count == 2
+    assert second.message_count == 4
+    assert second.latest_response is not None
+    assert second.latest_response.query == "second question"
+    assert second.selected_document_ids == ["doc-1", "doc-2"]
+
+
+def test_batch_append_turns_appends_in_order_with_last_snapshot(service: RagSessionStoreService) -> None:
+    record = service.batch_append_turns(
+        session_id="session-batch",
+        project_id="project-1",
+        turns=[
+            SessionTurnInput(
+                user_message="first question",
+                assistant_message="first answer",
+                selected_document_ids=["doc-1"],
+                latest_response=_build_response("session-batch", "first question"),
+            ),
+            SessionTurnInput(
+                user_message="second question",
+                assistant_message="second answer",
+                selected_document_ids=["doc-1", "doc-2"],
+                latest_response=_build_response("session-batch", "second question"),
+            ),
+        ],
+    )
+
+    assert record.message_count == 4
+    assert [message.content for message in record.messages] == [
+        "first question",
+        "first answer",
+        "second question",
+        "second answer",
+    ]
+    assert record.latest_response is not None
+    assert record.latest_response.query == "second question"
+    assert record.selected_document_ids == ["doc-1", "doc-2"]
@@ -14,6 +14,47 @@ from src.reranked.routes import (
     rag_reranked_chat_stateless,
 )
 
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_TEMPLATE_RESPONSE = RagRerankedChatResponse(
+    mode="stateless",
+    session_id=None,
+    project_id="project-1",
+    query="",
+    answer="Answer",
+    chat_model="gpt-oss:20b",
+    embedding_model="bge-m3:latest",
+    rerank_model="bge-reranker-v2-m3:latest",
+    hybrid_candidates=[],
+    sources=[
+        RagRerankedSourceChunk(
+            rank=1,
+            source_id="S1",
+            chunk_key="doc-1:0",
+            document_id="doc-1",
+            document_name="Doc One",
+            chunk_index=0,
+            context_header="Header",
+            text="Chunk text",
+            dense_score=0.9,
+            sparse_score=0.7,
+            hybrid_score=0.85,
+            original_rank=2,
+            rerank_score=0.95,
+        )
+    ],
+    documents=[
+        RagRerankedSourceDocument(
+            document_id="doc-1",
+            document_name="Doc One",
+            hit_count=1,
+            top_rank=1,
+            chunk_indices=[0],
+        )
+    ],
+    citations_used=["S1"],
+    created_at=_NOW,
+)
+
 
 class FakeRagRerankedChatService:
     """Minimal reranked service stub for route-level tests."""
@@ -47,42 +88,8 @@ class FakeRagRerankedChatService:
         project_id: str,
         query: str,
     ) -> RagRerankedChatResponse:
-        source = RagRerankedSourceChunk(
-            rank=1,
-            source_id="S1",
-            chunk_key="doc-1:0",
-            document_id="doc-1",
-            document_name="Doc One",
-            chunk_index=0,
-            context_header="Header",
-            text="Chunk text",
-            dense_score=0.9,
-            sparse_score=0.7,
-            hybrid_score=0.85,
-            original_rank=2,
-            rerank_score=0.95,
-        )
-        document = RagRerankedSourceDocument(
-            document_id="doc-1",
-            document_name="Doc One",
-            hit_count=1,
-            top_rank=1,
-            chunk_indices=[0],
-        )
-        return RagRerankedChatResponse(
-            mode=mode,  # type: ignore[arg-type]
-            session_id=session_id,
-            project_id=project_id,
-            query=query,
-            answer="Answer",
-            chat_model="gpt-oss:20b",
-            embedding_model="bge-m3:latest",
-            rerank_model="bge-reranker-v2-m3:latest",
-            hybrid_candidates=[],
-            sources=[source],
-            documents=[document],
-            citations_used=["S1"],
-            created_at=datetime.now(timezone.utc),
+        return _TEMPLATE_RESPONSE.model_copy(
+            update={"mode": mode, "session_id": session_id, "project_id": project_id, "query": query}
         )
 
 
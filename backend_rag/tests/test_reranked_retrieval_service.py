@@ -1,8 +1,75 @@
 from __future__ import annotations
 
+import numpy as np
+
 from src.models.runtime.retrieval import HybridRetrieveResult, RankedSourceChunk, RetrievedSourceDocument
-from src.reranked.retrieval_service import RerankedRetrievalService
 from src.reranked.runtime import RerankedRetrieveInput
+from src.tools.inference_api_client import RERANK_ROW_DTYPE
+
+_RERANK_ROWS = np.array([(0, 0.91), (2, 0.97)], dtype=RERANK_ROW_DTYPE)
+_STUB_SOURCES = (
+    RankedSourceChunk(
+        chunk_key="doc-1:0",
+        document_id="doc-1",
+        document_name="Doc One",
+        chunk_index=0,
+        context_header="h0",
+        text="chunk zero",
+        source_id="S1",
+        rank=1,
+        dense_score=0.91,
+        sparse_score=0.42,
+        hybrid_score=0.85,
+    ),
+    RankedSourceChunk(
+        chunk_key="doc-2:0",
+        document_id="doc-2",
+        document_name="Doc Two",
+        chunk_index=0,
+        context_header="h1",
+        text="chunk one",
+        source_id="S2",
+        rank=2,
+        dense_score=0.88,
+        sparse_score=0.55,
+        hybrid_score=0.83,
+    ),
+    RankedSourceChunk(
+        chunk_key="doc-3:0",
+        document_id="doc-3",
+        document_name="Doc Three",
+        chunk_index=0,
+        context_header="h2",
+        text="chunk two",
+        source_id="S3",
+        rank=3,
+        dense_score=0.77,
+        sparse_score=0.66,
+        hybrid_score=0.79,
+    ),
+    RankedSourceChunk(
+        chunk_key="doc-4:0",
+        document_id="doc-4",
+        document_name="Doc Four",
+        chunk_index=0,
+        context_header="h3",
+        text="chunk three",
+        source_id="S4",
+        rank=4,
+        dense_score=0.63,
+        sparse_score=0.61,
+        hybrid_score=0.68,
+    ),
+)
+_STUB_DOCUMENTS = (
+    RetrievedSourceDocument(
+        document_id="doc-1",
+        document_name="Doc One",
+        hit_count=1,
+        top_rank=1,
+        chunk_indices=[0],
+    ),
+)
 
 
 class _StubHybridRetrievalService:
@@ -12,69 +79,8 @@ class _StubHybridRetrievalService:
             project_id=request.project_id,
             query=request.query,
             embedding_model=request.embedding_model,
-            sources=[
-                RankedSourceChunk(
-                    chunk_key="doc-1:0",
-                    document_id="doc-1",
-                    document_name="Doc One",
-                    chunk_index=0,
-                    context_header="h0",
-                    text="chunk zero",
-                    source_id="S1",
-                    rank=1,
-                    dense_score=0.91,
-                    sparse_score=0.42,
-                    hybrid_score=0.85,
-                ),
-                RankedSourceChunk(
-                    chunk_key="doc-2:0",
-                    document_id="doc-2",
-                    document_name="Doc Two",
-                    chunk_index=0,
-                    context_header="h1",
-                    text="chunk one",
-                    source_id="S2",
-                    rank=2,
-                    dense_score=0.88,
-                    sparse_score=0.55,
-                    hybrid_score=0.83,
-                ),
-                RankedSourceChunk(
-                    chunk_key="doc-3:0",
-                    document_id="doc-3",
-                    document_name="Doc Three",
-                    chunk_index=0,
-                    context_header="h2",
-                    text="chunk two",
-                    source_id="S3",
-                    rank=3,
-                    dense_score=0.77,
-                    sparse_score=0.66,
-                    hybrid_score=0.79,
-                ),
-                RankedSourceChunk(
-                    chunk_key="doc-4:0",
-                    document_id="doc-4",
-                    document_name="Doc Four",
-                    chunk_index=0,
-                    context_header="h3",
-                    text="chunk three",
-                    source_id="S4",
-                    rank=4,
-                    dense_score=0.63,
-                    sparse_score=0.61,
-                    hybrid_score=0.68,
-                ),
-            ],
-            documents=[
-                RetrievedSourceDocument(
-                    document_id="doc-1",
-                    document_name="Doc One",
-                    hit_count=1,
-                    top_rank=1,
-                    chunk_indices=[0],
-                )
-            ],
+            sources=list(_STUB_SOURCES),
+            documents=list(_STUB_DOCUMENTS),
         )
 
 
@@ -84,10 +90,12 @@ class _StubInferenceClient:
         assert query == "what changed"
         assert documents == ["chunk zero", "chunk one", "chunk two", "chunk three"]
         assert top_n == 2
-        return [(2, 0.97), (0, 0.91)]
+        return _RERANK_ROWS
 
 
 def test_reranked_retrieval_reorders_hybrid_candidates() -> None:
+    from src.reranked.retrieval_service import RerankedRetrievalService
+
     service = RerankedRetrievalService(
         hybrid_retrieval_service=_StubHybridRetrievalService(),
         inference_client=_StubInferenceClient(),
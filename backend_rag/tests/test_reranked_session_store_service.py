@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.core.exceptions import ResourceNotFoundError
+from src.models.runtime.session import SessionTurnInput
+from src.reranked.models import RagRerankedChatResponse
+from src.reranked.session_store_service import RagRerankedSessionStoreService
+from src.services.rag_session_store_service import RagSessionStoreService
+
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _build_response(session_id: str, query: str) -> RagRerankedChatResponse:
+    return RagRerankedChatResponse(
+        mode="session",
+        session_id=session_id,
+        project_id="project-1",
+        query=query,
+        answer="Grounded answer",
+        chat_model="gpt-oss:20b",
+        embedding_model="bge-m3:latest",
+        rerank_model="bge-reranker-v2-m3:latest",
+        hybrid_candidates=[],
+        sources=[],
+        documents=[],
+        citations_used=[],
+        created_at=_NOW,
+    )
+
+
+def test_reranked_append_turn_is_isolated_from_hybrid_sessions(session_store_factory: sessionmaker[Session]) -> None:
+    service = RagRerankedSessionStoreService(session_store_factory)
+
+    first = service.append_turn(
+        session_id="session-abc",
+        project_id="project-1",
+        user_message="first question",
+        assistant_message="first answer",
+        selected_document_ids=["doc-1"],
+        latest_response=_build_response("session-abc", "first question"),
+    )
+    second = service.append_turn(
+        session_id="session-abc",
+        project_id="project-1",
+        user_message="second question",
+        assistant_message="second answer",
+        selected_document_ids=None,
+        latest_response=_build_response("session-abc", "second question"),
+    )
+
+    assert first.message_count == 2
+    assert second.message_count == 4
+    assert second.latest_response is not None
+    assert second.latest_response.rerank_model == "bge-reranker-v2-m3:latest"
+    assert [session.id for session in service.list_sessions().sessions] == ["session-abc"]
+
+    with pytest.raises(ResourceNotFoundError):
+        RagSessionStoreService(session_store_factory).get_session("session-abc")
+
+
+def test_reranked_batch_append_turns_appends_in_order_with_last_snapshot(
+    session_store_factory: sessionmaker[Session],
+) -> None:
+    service = RagRerankedSessionStoreService(session_store_factory)
+
+    record = service.batch_append_turns(
+        session_id="session-batch",
+        project_id="project-1",
+        turns=[
+            SessionTurnInput(
+                user_message="first question",
+                assistant_message="first answer",
+                selected_document_ids=["doc-1"],
+                latest_response=_build_response("session-batch", "first question"),
+            ),
+            SessionTurnInput(
+                user_message="second question",
+                assistant_message="second answer",
+                selected_document_ids=["doc-1", "doc-2"],
+                latest_response=_build_response("session-batch", "second question"),
+            ),
+        ],
+    )
+
+    assert [message.content for message in record.messages] == [
+        "first question",
+        "first answer",
+        "second question",
+        "second answer",
+    ]
+    assert record.latest_response is not None
+    assert record.latest_response.query == "second question"
+    assert record.selected_document_ids == ["doc-1", "doc-2"]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import orjson
+
 from src.core.config import Settings
 from src.core.exceptions import (
     DomainError,
@@ -31,25 +33,26 @@ async def test_validation_error_handler_maps_to_400() -> None:
     response = await handle_validation(None, ValidationDomainError("invalid payload"))  # type: ignore[arg-type]
 
     assert response.status_code == 400
-    assert response.body == b'{"detail":"invalid payload"}'
+    assert response.headers["content-type"] == "application/json"
+    assert orjson.loads(response.body) == {"detail": "invalid payload"}
 
 
 async def test_not_found_handler_maps_to_404() -> None:
     response = await handle_not_found(None, ResourceNotFoundError("missing"))  # type: ignore[arg-type]
 
     assert response.status_code == 404
-    assert response.body == b'{"detail":"missing"}'
+    assert orjson.loads(response.body) == {"detail": "missing"}
 
 
 async def test_external_handler_maps_to_502() -> None:
     response = await handle_external(None, ExternalServiceError("upstream failed"))  # type: ignore[arg-type]
 
     assert response.status_code == 502
-    assert response.body == b'{"detail":"upstream failed"}'
+    assert orjson.loads(response.body) == {"detail": "upstream failed"}
 
 
 async def test_domain_error_handler_maps_to_400() -> None:
     response = await handle_domain(None, DomainError("domain failure"))  # type: ignore[arg-type]
 
     assert response.status_code == 400
-    assert response.body == b'{"detail":"domain failure"}'
+    assert orjson.loads(response.body) == {"detail": "domain failure"}
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
 
 from src.models.api.rag import RagHybridChatResponse
 from src.models.api.session import (
@@ -11,67 +17,122 @@ from src.models.api.session import (
     RagSessionSummary,
     RagSessionUpdateRequest,
 )
-from src.routes.sessions import create_session, delete_session, get_session, list_sessions, update_session
-
-
-def _build_response(session_id: str) -> RagHybridChatResponse:
-    return RagHybridChatResponse(
-        mode="session",
-        session_id=session_id,
-        project_id="project-1",
-        query="What changed?",
-        answer="Grounded answer",
-        chat_model="gpt-oss:20b",
-        embedding_model="bge-m3:latest",
-        sources=[],
-        documents=[],
-        citations_used=[],
-        created_at=datetime.now(timezone.utc),
-    )
-
-
-def _build_record(session_id: str) -> RagSessionRecord:
-    now = datetime.now(timezone.utc)
-    return RagSessionRecord(
-        id=session_id,
-        project_id="project-1",
-        title="Session One",
-        message_count=2,
-        created_at=now,
-        updated_at=now,
-        selected_document_ids=["doc-1"],
-        selected_source_id="S1",
-        latest_response=_build_response(session_id),
-        messages=[
-            RagSessionMessage(
-                id="msg-1",
-                role="user",
-                content="hi",
-                created_at=now,
-            ),
-            RagSessionMessage(
-                id="msg-2",
-                role="assistant",
-                content="hello",
-                created_at=now,
-            ),
-        ],
-    )
+from src.reranked import session_routes as reranked_session_routes
+from src.reranked.models import (
+    RagRerankedChatResponse,
+    RagRerankedSessionCreateRequest,
+    RagRerankedSessionListResponse,
+    RagRerankedSessionMessage,
+    RagRerankedSessionRecord,
+    RagRerankedSessionSummary,
+    RagRerankedSessionUpdateRequest,
+)
+from src.routes import sessions as session_routes
+
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_RESPONSE_FIELDS: dict[str, Any] = {
+    "mode": "session",
+    "session_id": "session-1",
+    "project_id": "project-1",
+    "query": "What changed?",
+    "answer": "Grounded answer",
+    "chat_model": "gpt-oss:20b",
+    "embedding_model": "bge-m3:latest",
+    "sources": [],
+    "documents": [],
+    "citations_used": [],
+    "created_at": _NOW,
+}
+_RECORD_FIELDS: dict[str, Any] = {
+    "id": "session-1",
+    "project_id": "project-1",
+    "title": "Session One",
+    "message_count": 2,
+    "created_at": _NOW,
+    "updated_at": _NOW,
+    "selected_document_ids": ["doc-1"],
+    "selected_source_id": "S1",
+}
+_MESSAGE_FIELDS: list[dict[str, Any]] = [
+    {"id": "msg-1", "role": "user", "content": "hi", "created_at": _NOW},
+    {"id": "msg-2", "role": "assistant", "content": "hello", "created_at": _NOW},
+]
+
+
+@dataclass(frozen=True)
+class _SessionRouteFlavor:
+    """Model types and route handlers for one session API flavor."""
+
+    record: BaseModel
+    list_response_model: type[BaseModel]
+    summary_model: type[BaseModel]
+    create_request_model: type[BaseModel]
+    update_request_model: type[BaseModel]
+    list_route: Callable[..., Any]
+    create_route: Callable[..., Any]
+    get_route: Callable[..., Any]
+    update_route: Callable[..., Any]
+    delete_route: Callable[..., Any]
+
+
+_HYBRID_FLAVOR = _SessionRouteFlavor(
+    record=RagSessionRecord(
+        **_RECORD_FIELDS,
+        latest_response=RagHybridChatResponse(**_RESPONSE_FIELDS),
+        messages=[RagSessionMessage(**fields) for fields in _MESSAGE_FIELDS],
+    ),
+    list_response_model=RagSessionListResponse,
+    summary_model=RagSessionSummary,
+    create_request_model=RagSessionCreateRequest,
+    update_request_model=RagSessionUpdateRequest,
+    list_route=session_routes.list_sessions,
+    create_route=session_routes.create_session,
+    get_route=session_routes.get_session,
+    update_route=session_routes.update_session,
+    delete_route=session_routes.delete_session,
+)
+_RERANKED_FLAVOR = _SessionRouteFlavor(
+    record=RagRerankedSessionRecord(
+        **_RECORD_FIELDS,
+        latest_response=RagRerankedChatResponse(
+            **_RESPONSE_FIELDS,
+            rerank_model="bge-reranker-v2-m3:latest",
+            hybrid_candidates=[],
+        ),
+        messages=[RagRerankedSessionMessage(**fields) for fields in _MESSAGE_FIELDS],
+    ),
+    list_response_model=RagRerankedSessionListResponse,
+    summary_model=RagRerankedSessionSummary,
+    create_request_model=RagRerankedSessionCreateRequest,
+    update_request_model=RagRerankedSessionUpdateRequest,
+    list_route=reranked_session_routes.list_reranked_sessions,
+    create_route=reranked_session_routes.create_reranked_session,
+    get_route=reranked_session_routes.get_reranked_session,
+    update_route=reranked_session_routes.update_reranked_session,
+    delete_route=reranked_session_routes.delete_reranked_session,
+)
+
+parametrize_flavor = pytest.mark.parametrize(
+    "flavor",
+    [_HYBRID_FLAVOR, _RERANKED_FLAVOR],
+    ids=["hybrid", "reranked"],
+)
 
 
 class FakeSessionStoreService:
     """Simple stub for session route tests."""
 
-    def __init__(self) -> None:
+    def __init__(self, flavor: _SessionRouteFlavor) -> None:
         self.deleted_ids: list[str] = []
         self.last_filter: str | None = None
-        self.record = _build_record("session-1")
+        self.flavor = flavor
+        self.record: Any = flavor.record.model_copy()
 
-    def list_sessions(self, project_id: str | None = None) -> RagSessionListResponse:
+    def list_sessions(self, project_id: str | None = None) -> BaseModel:
         self.last_filter = project_id
-        return RagSessionListResponse(
+        return self.flavor.list_response_model.model_construct(
             sessions=[
-                RagSessionSummary(
+                self.flavor.summary_model.model_construct(
                     id=self.record.id,
                     project_id=self.record.project_id,
                     title=self.record.title,
@@ -82,15 +143,15 @@ class FakeSessionStoreService:
             ]
         )
 
-    def create_session(self, request: RagSessionCreateRequest) -> RagSessionRecord:
+    def create_session(self, request: Any) -> BaseModel:
         self.record.project_id = request.project_id
         return self.record
 
-    def get_session(self, session_id: str) -> RagSessionRecord:
+    def get_session(self, session_id: str) -> BaseModel:
         self.record.id = session_id
         return self.record
 
-    def update_session(self, session_id: str, request: RagSessionUpdateRequest) -> RagSessionRecord:
+    def update_session(self, session_id: str, request: Any) -> BaseModel:
         self.record.id = session_id
         if request.title is not None:
             self.record.title = request.title
@@ -100,29 +161,25 @@ class FakeSessionStoreService:
         self.deleted_ids.append(session_id)
 
 
-def test_list_sessions_route_supports_project_filter() -> None:
-    service = FakeSessionStoreService()
+@parametrize_flavor
+def test_list_sessions_route_supports_project_filter(flavor: _SessionRouteFlavor) -> None:
+    service = FakeSessionStoreService(flavor)
 
-    payload = list_sessions(project_id="project-1", service=service)  # type: ignore[arg-type]
+    payload = flavor.list_route(project_id="project-1", service=service)
 
+    assert isinstance(payload, flavor.list_response_model)
     assert payload.sessions[0].id == "session-1"
     assert service.last_filter == "project-1"
 
 
-def test_create_get_update_delete_session_routes() -> None:
-    service = FakeSessionStoreService()
-
-    created = create_session(
-        RagSessionCreateRequest(project_id="project-1"),
-        service,  # type: ignore[arg-type]
-    )
-    loaded = get_session("session-abc", service)  # type: ignore[arg-type]
-    updated = update_session(
-        "session-abc",
-        RagSessionUpdateRequest(title="Renamed"),
-        service,  # type: ignore[arg-type]
-    )
-    deleted = delete_session("session-abc", service)  # type: ignore[arg-type]
+@parametrize_flavor
+def test_create_get_update_delete_session_routes(flavor: _SessionRouteFlavor) -> None:
+    service = FakeSessionStoreService(flavor)
+
+    created = flavor.create_route(flavor.create_request_model(project_id="project-1"), service)
+    loaded = flavor.get_route("session-abc", service)
+    updated = flavor.update_route("session-abc", flavor.update_request_model(title="Renamed"), service)
+    deleted = flavor.delete_route("session-abc", service)
 
     assert created.project_id == "project-1"
     assert loaded.id == "session-abc"
@@ -14,10 +14,16 @@ def test_chunk_text_splits_expected_boundaries() -> None:
 def test_sse_event_serializes_event_and_payload() -> None:
     event = _sse_event("meta", {"session_id": "s-1", "project_id": "p-1"})
 
-    assert event.startswith("event: meta\n")
-    assert event.endswith("\n\n")
+    assert event.startswith(b"event: meta\n")
+    assert event.endswith(b"\n\n")
 
-    data_line = [line for line in event.splitlines() if line.startswith("data:")][0]
+    data_line = [line for line in event.decode("utf-8").splitlines() if line.startswith("data:")][0]
     payload = json.loads(data_line.removeprefix("data:").strip())
     assert payload["session_id"] == "s-1"
     assert payload["project_id"] == "p-1"
+
+
+def test_sse_event_keeps_non_ascii_text_unescaped() -> None:
+    event = _sse_event("delta", {"content": "Café ✓"})
+
+    assert event == 'event: delta\ndata: {"content":"Café ✓"}\n\n'.encode()
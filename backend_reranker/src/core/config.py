@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -16,7 +19,11 @@ class Settings(BaseSettings):
     rerank_max_length: int = Field(default=1024)
     rerank_batch_size: int = Field(default=16)
     rerank_use_fp16: bool = Field(default=True)
-    rerank_unload_after_request: bool = Field(default=True)
+    rerank_cuda_graphs: bool = Field(default=False)
+    rerank_idle_ttl_seconds: float = Field(default=60.0)
+    rerank_max_cached_models: int = Field(default=2, ge=1)
+    rerank_runtime: Literal["torch", "onnx-int8"] = Field(default="torch")
+    rerank_onnx_cache_dir: str = Field(default="/cache/huggingface/rerank-onnx-int8")
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -25,7 +32,8 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
-    """Load a fresh settings object."""
+    """Load settings once per process; call load_settings.cache_clear() to re-read the environment."""
 
     return Settings()
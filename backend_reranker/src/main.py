@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 
 from src.core.config import load_settings
+from src.core.cors import CORSFastMiddleware
 from src.core.exceptions import DomainError, ExternalServiceError, ValidationDomainError
 from src.routes.health import router as health_router
 from src.routes.rerank import router as rerank_router
+from src.services.rerank_service import RerankService
 from src.services.service_factory import build_rerank_service
 
 
@@ -19,9 +22,31 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Initialize app-scoped settings and service instances."""
 
     settings = load_settings()
+    service = build_rerank_service(settings=settings)
     app.state.settings = settings
-    app.state.rerank_service = build_rerank_service(settings=settings)
-    yield
+    app.state.rerank_service = service
+
+    evictor = None
+    if settings.rerank_idle_ttl_seconds > 0:
+        evictor = asyncio.create_task(_evict_idle_models(service, settings.rerank_idle_ttl_seconds))
+
+    try:
+        yield
+    finally:
+        if evictor is not None:
+            evictor.cancel()
+            with suppress(asyncio.CancelledError):
+                await evictor
+        service.unload_all_models()
+
+
+async def _evict_idle_models(service: RerankService, idle_ttl_seconds: float) -> None:
+    """Periodically unload reranker models that have been idle for the configured TTL."""
+
+    while True:
+        await asyncio.sleep(idle_ttl_seconds)
+        # Unloading runs gc.collect() plus torch empty_cache/ipc_collect, which are slow; keep them off the loop.
+        await asyncio.to_thread(service.unload_idle_models, idle_ttl_seconds)
 
 
 app = FastAPI(
@@ -34,15 +59,14 @@ app = FastAPI(
 )
 
 app.add_middleware(
-    CORSMiddleware,
+    CORSFastMiddleware,
     allow_origins=[
         "http://localhost:5173",
         "http://127.0.0.1:5173",
     ],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
 )
+# Only large rerank payloads clear the threshold; level 1 keeps compression CPU near free.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
 
 
 @app.exception_handler(ValidationDomainError)
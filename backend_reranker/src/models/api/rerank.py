@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class HealthResponse(BaseModel):
@@ -24,6 +24,20 @@ class RerankRequest(BaseModel):
     documents: Annotated[list[str], Field(min_length=1, description="Candidate documents to rerank")]
     top_n: Annotated[int | None, Field(default=None, ge=1, le=200, description="Optional top-N cutoff")]
 
+    @field_validator("query", mode="after")
+    @classmethod
+    def _strip_query(cls, value: str) -> str:
+        """Strip surrounding whitespace; emptiness is reported by the service as a domain error."""
+
+        return value.strip()
+
+    @field_validator("documents", mode="after")
+    @classmethod
+    def _strip_documents(cls, value: list[str]) -> list[str]:
+        """Strip documents and drop blank ones while the request is validated."""
+
+        return [stripped for item in value if (stripped := item.strip())]
+
 
 class RerankResultRow(BaseModel):
     """One reranked document reference with relevance score."""
@@ -1,21 +1,18 @@
 from __future__ import annotations
 
-from typing import Annotated
+from fastapi import APIRouter, Request, Response
 
-from fastapi import APIRouter, Depends
-
-from src.core.dependencies import get_rerank_service
 from src.models.api.rerank import RerankRequest, RerankResponse
 from src.services.rerank_service import RerankService
 
 router = APIRouter(tags=["Rerank"])
 
 
-@router.post("/rerank")
-def rerank(
-    data: RerankRequest,
-    service: Annotated[RerankService, Depends(get_rerank_service)],
-) -> RerankResponse:
+@router.post("/rerank", response_model=None, responses={200: {"model": RerankResponse}})
+async def rerank(data: RerankRequest, request: Request) -> Response:
     """Score and rank candidate documents for a single query."""
 
-    return service.rerank(data)
+    # Read the app-scoped service directly; this hot route skips the dependency solver for it.
+    service: RerankService = request.app.state.rerank_service
+    response = await service.arerank(data)
+    return Response(content=response.model_dump_json(), media_type="application/json")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from src.core.exceptions import ValidationDomainError
 from src.models.api.rerank import RerankRequest, RerankResponse, RerankResultRow
+from src.models.runtime.rerank import RerankRunResult
 from src.tools.cross_encoder_reranker import CrossEncoderReranker
 
 
@@ -28,14 +29,48 @@ class RerankService:
 
         return self._reranker.loaded_models()
 
+    def unload_idle_models(self, max_idle_seconds: float) -> list[str]:
+        """Unload models idle for at least max_idle_seconds and return their ids."""
+
+        return self._reranker.unload_idle_models(max_idle_seconds)
+
+    def unload_all_models(self) -> int:
+        """Unload every cached model and return how many were released."""
+
+        return self._reranker.unload_all_models()
+
     def rerank(self, request: RerankRequest) -> RerankResponse:
         """Validate request and return ranked documents."""
 
-        query = request.query.strip()
+        query, documents, top_n = self._normalize_request(request)
+        run = self._reranker.rerank(
+            model=request.model,
+            query=query,
+            documents=documents,
+            top_n=top_n,
+        )
+        return self._build_response(request, run)
+
+    async def arerank(self, request: RerankRequest) -> RerankResponse:
+        """Validate request and return ranked documents without blocking the event loop."""
+
+        query, documents, top_n = self._normalize_request(request)
+        run = await self._reranker.arerank(
+            model=request.model,
+            query=query,
+            documents=documents,
+            top_n=top_n,
+        )
+        return self._build_response(request, run)
+
+    def _normalize_request(self, request: RerankRequest) -> tuple[str, list[str], int | None]:
+        """Reject requests with nothing left to score after validation stripped blanks."""
+
+        query = request.query
         if not query:
             raise ValidationDomainError("query must not be empty")
 
-        documents = [item.strip() for item in request.documents if isinstance(item, str) and item.strip()]
+        documents = request.documents
         if not documents:
             raise ValidationDomainError("documents must contain at least one non-empty item")
 
@@ -43,18 +78,17 @@ class RerankService:
         if top_n is not None and top_n > len(documents):
             top_n = len(documents)
 
-        run = self._reranker.rerank(
-            model=request.model,
-            query=query,
-            documents=documents,
-            top_n=top_n,
-        )
+        return query, documents, top_n
+
+    def _build_response(self, request: RerankRequest, run: RerankRunResult) -> RerankResponse:
+        """Map a reranker run onto the API response model."""
 
-        return RerankResponse(
+        # Rows come straight from the reranker with known-good types, so skip per-row validation.
+        return RerankResponse.model_construct(
             model=request.model,
             resolved_model=run.resolved_model,
             results=[
-                RerankResultRow(index=row.index, relevance_score=row.relevance_score)
+                RerankResultRow.model_construct(index=row.index, relevance_score=row.relevance_score)
                 for row in run.results
             ],
         )
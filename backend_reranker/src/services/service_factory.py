@@ -15,6 +15,9 @@ def build_rerank_service(settings: Settings) -> RerankService:
             max_length=settings.rerank_max_length,
             batch_size=settings.rerank_batch_size,
             use_fp16=settings.rerank_use_fp16,
-            unload_after_request=settings.rerank_unload_after_request,
+            runtime=settings.rerank_runtime,
+            onnx_cache_dir=settings.rerank_onnx_cache_dir,
+            max_cached_models=settings.rerank_max_cached_models,
+            cuda_graphs=settings.rerank_cuda_graphs,
         )
     )
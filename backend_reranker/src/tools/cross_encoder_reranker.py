@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Sequence
+import asyncio
 import gc
 import threading
-from typing import Protocol
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from functools import partial
+from pathlib import Path
+from typing import Literal, Protocol
 
 import numpy as np
 
 from src.core.exceptions import ExternalServiceError
 from src.models.runtime.rerank import RerankResult, RerankRunResult
+from src.tools.pretokenized_cross_encoder import PretokenizedCrossEncoder
 
 
 class _CrossEncoderModel(Protocol):
@@ -23,6 +29,10 @@ class _CrossEncoderModel(Protocol):
 
 
 ModelLoader = Callable[[str, str, int, bool], _CrossEncoderModel]
+RerankRuntime = Literal["torch", "onnx-int8"]
+
+_ONNX_INT8_QUANTIZATION = "avx512_vnni"
+_ONNX_INT8_FILE = f"onnx/model_qint8_{_ONNX_INT8_QUANTIZATION}.onnx"
 
 
 MODEL_ALIASES: dict[str, str] = {
@@ -42,19 +52,34 @@ class CrossEncoderReranker:
         max_length: int,
         batch_size: int,
         use_fp16: bool,
-        unload_after_request: bool = True,
+        runtime: RerankRuntime = "torch",
+        onnx_cache_dir: str = "",
+        max_cached_models: int = 2,
+        cuda_graphs: bool = False,
         model_loader: ModelLoader | None = None,
     ) -> None:
         self._default_model = default_model
-        self._resolved_device = self._resolve_device(configured_device)
+        self._default_resolved_model = MODEL_ALIASES.get(default_model, default_model)
+        self._runtime = runtime
+        self._onnx_cache_dir = Path(onnx_cache_dir)
+        # Dynamically quantized int8 ONNX graphs target CPU VNNI kernels, so that runtime always runs on CPU.
+        self._resolved_device = "cpu" if runtime == "onnx-int8" else self._resolve_device(configured_device)
         self._max_length = max(max_length, 64)
         self._batch_size = max(batch_size, 1)
         self._use_fp16 = use_fp16
-        self._unload_after_request = unload_after_request
+        self._max_cached_models = max(max_cached_models, 1)
+        self._cuda_graphs = cuda_graphs
         self._model_loader = model_loader or self._load_model
 
-        self._model_cache: dict[str, _CrossEncoderModel] = {}
+        self._model_cache: OrderedDict[str, _CrossEncoderModel] = OrderedDict()
+        self._last_used: dict[str, float] = {}
+        self._in_flight: dict[str, int] = {}
+        # Guards the cache bookkeeping only; model loads run under per-model load locks, never under this one.
         self._cache_lock = threading.Lock()
+        self._load_locks: dict[str, threading.Lock] = {}
+        self._load_lock_users: dict[str, int] = {}
+        # Touched only from the event loop: one shared worker load per cold model, dropped once it settles.
+        self._pending_loads: dict[str, asyncio.Future[_CrossEncoderModel]] = {}
 
     @property
     def resolved_device(self) -> str:
@@ -73,20 +98,11 @@ class CrossEncoderReranker:
 
         return sorted(self._model_cache.keys())
 
-    @property
-    def unload_after_request(self) -> bool:
-        """Return whether models are unloaded after each rerank call."""
-
-        return self._unload_after_request
-
     def resolve_model_name(self, model: str) -> str:
         """Resolve aliases into canonical model identifiers."""
 
         candidate = model.strip()
-        if not candidate:
-            return MODEL_ALIASES.get(self._default_model, self._default_model)
-
-        return MODEL_ALIASES.get(candidate, candidate)
+        return MODEL_ALIASES.get(candidate, candidate) if candidate else self._default_resolved_model
 
     def rerank(
         self,
@@ -99,10 +115,65 @@ class CrossEncoderReranker:
         """Score query-document pairs and return descending relevance rows."""
 
         resolved_model = self.resolve_model_name(model)
-        encoder: _CrossEncoderModel | None = None
+        encoder = self._acquire_model(resolved_model)
         try:
-            encoder = self._get_or_load_model(resolved_model)
+            return self._score(encoder, resolved_model, query, documents, top_n)
+        finally:
+            self._release_model(resolved_model)
 
+    async def arerank(
+        self,
+        *,
+        model: str,
+        query: str,
+        documents: list[str],
+        top_n: int | None,
+    ) -> RerankRunResult:
+        """Async variant that waits for model loads on the event loop and runs model work in threads."""
+
+        resolved_model = self.resolve_model_name(model)
+        if resolved_model not in self._model_cache:
+            await self._await_model_load(resolved_model)
+        # Acquire, score and release inside one worker call so a cancelled request cannot leak an in-flight mark.
+        return await asyncio.to_thread(
+            self.rerank,
+            model=resolved_model,
+            query=query,
+            documents=documents,
+            top_n=top_n,
+        )
+
+    async def _await_model_load(self, model_name: str) -> None:
+        """Share one worker-thread load per cold model among concurrent coroutines."""
+
+        pending = self._pending_loads.get(model_name)
+        if pending is None or pending.done():
+            pending = asyncio.ensure_future(asyncio.to_thread(self._get_or_load_model, model_name))
+            self._pending_loads[model_name] = pending
+            pending.add_done_callback(partial(self._forget_pending_load, model_name))
+
+        # Shield the shared load so one cancelled request does not abort it for the others.
+        await asyncio.shield(pending)
+
+    def _forget_pending_load(self, model_name: str, pending: asyncio.Future[_CrossEncoderModel]) -> None:
+        """Drop a settled load so failed or evicted client-supplied model names leave no entry behind."""
+
+        if self._pending_loads.get(model_name) is pending:
+            del self._pending_loads[model_name]
+
+    def _score(
+        self,
+        encoder: _CrossEncoderModel,
+        resolved_model: str,
+        query: str,
+        documents: list[str],
+        top_n: int | None,
+    ) -> RerankRunResult:
+        """Run the model over query-document pairs and build descending relevance rows."""
+
+        if isinstance(encoder, PretokenizedCrossEncoder):
+            raw_scores = encoder.predict_query(query, documents, self._batch_size)
+        else:
             sentence_pairs = [(query, document) for document in documents]
             raw_scores = encoder.predict(
                 sentence_pairs,
@@ -110,54 +181,137 @@ class CrossEncoderReranker:
                 False,
             )
 
-            scores = self._normalize_scores(raw_scores=raw_scores, expected_count=len(documents))
-            ranked_indices = sorted(range(len(scores)), key=lambda idx: scores[idx], reverse=True)
+        scores = self._normalize_scores(raw_scores=raw_scores, expected_count=len(documents))
+        # A stable sort keeps tied scores in input order, including at a top_n cutoff.
+        order = np.argsort(-scores, kind="stable")
+        if top_n is not None:
+            order = order[: max(top_n, 1)]
+
+        # Convert only the selected slice to Python numbers, in one C-level pass per column.
+        results = [
+            RerankResult(
+                index=index,
+                relevance_score=score,
+            )
+            for index, score in zip(order.tolist(), scores[order].tolist(), strict=True)
+        ]
 
-            limit = len(ranked_indices) if top_n is None else min(max(top_n, 1), len(ranked_indices))
-            results = [
-                RerankResult(
-                    index=index,
-                    relevance_score=float(scores[index]),
-                )
-                for index in ranked_indices[:limit]
-            ]
+        return RerankRunResult(
+            resolved_model=resolved_model,
+            results=results,
+        )
 
-            return RerankRunResult(
-                resolved_model=resolved_model,
-                results=results,
-            )
-        finally:
-            if self._unload_after_request:
-                encoder = None
-                self.unload_model(resolved_model)
+    def _acquire_model(self, model_name: str) -> _CrossEncoderModel:
+        """Hand out a model and mark it in use so idle eviction skips it until released."""
+
+        with self._cache_lock:
+            cached = self._touch_cached_model(model_name)
+            if cached is not None:
+                self._in_flight[model_name] = self._in_flight.get(model_name, 0) + 1
+                return cached
+
+        return self._load_into_cache(model_name, acquire=True)
+
+    def _release_model(self, model_name: str) -> None:
+        """Drop one in-use mark and restart the idle clock for a still-cached model."""
+
+        with self._cache_lock:
+            remaining = self._in_flight.pop(model_name, 1) - 1
+            if remaining > 0:
+                self._in_flight[model_name] = remaining
+            if model_name in self._model_cache:
+                self._last_used[model_name] = time.monotonic()
+            # A load that found every cached model in use overshot the limit; trim back now one is free.
+            evicted = self._evict_idle_lru(self._max_cached_models)
+
+        if evicted:
+            self._release_accelerator_memory()
 
     def _get_or_load_model(self, model_name: str) -> _CrossEncoderModel:
-        """Return cached model instance or load it once per process."""
+        """Return cached model instance, loading it and evicting least-recently-used models as needed."""
 
-        cached = self._model_cache.get(model_name)
+        with self._cache_lock:
+            cached = self._touch_cached_model(model_name)
         if cached is not None:
             return cached
 
+        return self._load_into_cache(model_name, acquire=False)
+
+    def _touch_cached_model(self, model_name: str) -> _CrossEncoderModel | None:
+        """Return a cached model and mark it most recently used; the caller must hold the cache lock."""
+
+        cached = self._model_cache.get(model_name)
+        if cached is not None:
+            self._model_cache.move_to_end(model_name)
+            self._last_used[model_name] = time.monotonic()
+        return cached
+
+    def _evict_idle_lru(self, keep: int) -> bool:
+        """Evict least-recently-used models not in flight until at most keep remain; the caller holds the lock.
+
+        Models still serving a request are never evicted, since their memory could not be freed anyway, so the
+        cache temporarily exceeds RERANK_MAX_CACHED_MODELS when every cached model is in use.
+        """
+
+        excess = len(self._model_cache) - keep
+        if excess <= 0:
+            return False
+
+        idle_models = [name for name in self._model_cache if name not in self._in_flight][:excess]
+        for name in idle_models:
+            del self._model_cache[name]
+            self._last_used.pop(name, None)
+        return bool(idle_models)
+
+    def _load_into_cache(self, model_name: str, *, acquire: bool) -> _CrossEncoderModel:
+        """Load a model under its own load lock, then insert it and evict LRU entries under the cache lock."""
+
         with self._cache_lock:
-            cached = self._model_cache.get(model_name)
-            if cached is not None:
-                return cached
+            load_lock = self._load_locks.setdefault(model_name, threading.Lock())
+            self._load_lock_users[model_name] = self._load_lock_users.get(model_name, 0) + 1
 
-            try:
-                loaded = self._model_loader(
-                    model_name,
-                    self._resolved_device,
-                    self._max_length,
-                    self._use_fp16,
-                )
-            except Exception as error:  # noqa: BLE001
-                raise ExternalServiceError(
-                    "Cross-encoder model load failed. "
-                    f"model={model_name} device={self._resolved_device} details={error}"
-                ) from error
-
-            self._model_cache[model_name] = loaded
-            return loaded
+        try:
+            with load_lock:
+                with self._cache_lock:
+                    # Another thread may have finished this model's load while we waited on its lock.
+                    cached = self._touch_cached_model(model_name)
+                    if cached is not None:
+                        if acquire:
+                            self._in_flight[model_name] = self._in_flight.get(model_name, 0) + 1
+                        return cached
+
+                try:
+                    loaded = self._model_loader(
+                        model_name,
+                        self._resolved_device,
+                        self._max_length,
+                        self._use_fp16,
+                    )
+                except Exception as error:  # noqa: BLE001
+                    raise ExternalServiceError(
+                        "Cross-encoder model load failed. "
+                        f"model={model_name} device={self._resolved_device} details={error}"
+                    ) from error
+
+                with self._cache_lock:
+                    # Evict only after a successful load so a failed load never drops a warm model.
+                    evicted = self._evict_idle_lru(self._max_cached_models - 1)
+                    self._model_cache[model_name] = loaded
+                    self._last_used[model_name] = time.monotonic()
+                    if acquire:
+                        self._in_flight[model_name] = self._in_flight.get(model_name, 0) + 1
+
+                if evicted:
+                    self._release_accelerator_memory()
+                return loaded
+        finally:
+            with self._cache_lock:
+                # Keep the entry while any thread still waits on it, so a retry after a failed load stays serialized.
+                remaining = self._load_lock_users.pop(model_name) - 1
+                if remaining > 0:
+                    self._load_lock_users[model_name] = remaining
+                else:
+                    del self._load_locks[model_name]
 
     def unload_model(self, model_name: str) -> bool:
         """Unload one model from cache and release accelerator memory."""
@@ -165,6 +319,7 @@ class CrossEncoderReranker:
         resolved_model = self.resolve_model_name(model_name)
         with self._cache_lock:
             removed = self._model_cache.pop(resolved_model, None)
+            self._last_used.pop(resolved_model, None)
 
         if removed is None:
             return False
@@ -172,12 +327,32 @@ class CrossEncoderReranker:
         self._release_accelerator_memory()
         return True
 
+    def unload_idle_models(self, max_idle_seconds: float) -> list[str]:
+        """Unload models idle for at least max_idle_seconds, releasing accelerator memory once."""
+
+        with self._cache_lock:
+            cutoff = time.monotonic() - max_idle_seconds
+            idle_models = [
+                name
+                for name, last_used in self._last_used.items()
+                if last_used <= cutoff and name not in self._in_flight
+            ]
+            unloaded = [name for name in idle_models if self._model_cache.pop(name, None) is not None]
+            for name in idle_models:
+                self._last_used.pop(name, None)
+
+        if unloaded:
+            self._release_accelerator_memory()
+
+        return unloaded
+
     def unload_all_models(self) -> int:
         """Unload all cached models and release accelerator memory once."""
 
         with self._cache_lock:
             count = len(self._model_cache)
             self._model_cache.clear()
+            self._last_used.clear()
 
         if count > 0:
             self._release_accelerator_memory()
@@ -185,7 +360,10 @@ class CrossEncoderReranker:
         return count
 
     def _load_model(self, model_name: str, device: str, max_length: int, use_fp16: bool) -> _CrossEncoderModel:
-        """Load a sentence-transformers CrossEncoder model."""
+        """Load a sentence-transformers CrossEncoder model wrapped for query-once tokenization."""
+
+        if self._runtime == "onnx-int8":
+            return self._load_onnx_int8_model(model_name, max_length)
 
         from sentence_transformers import CrossEncoder
 
@@ -198,7 +376,28 @@ class CrossEncoderReranker:
             except Exception:  # noqa: BLE001
                 pass
 
-        return model
+        return PretokenizedCrossEncoder(model, cuda_graphs=self._cuda_graphs, graph_batch_size=self._batch_size)
+
+    def _load_onnx_int8_model(self, model_name: str, max_length: int) -> _CrossEncoderModel:
+        """Load a dynamically int8-quantized ONNX export, quantizing and caching it on first use."""
+
+        from sentence_transformers import CrossEncoder
+        from sentence_transformers.backend import export_dynamic_quantized_onnx_model
+
+        export_dir = self._onnx_cache_dir / model_name.replace("/", "--")
+        if not (export_dir / _ONNX_INT8_FILE).is_file():
+            onnx_model = CrossEncoder(model_name, device="cpu", max_length=max_length, backend="onnx")
+            onnx_model.save_pretrained(str(export_dir))
+            export_dynamic_quantized_onnx_model(onnx_model, _ONNX_INT8_QUANTIZATION, str(export_dir))
+
+        model = CrossEncoder(
+            str(export_dir),
+            device="cpu",
+            max_length=max_length,
+            backend="onnx",
+            model_kwargs={"file_name": _ONNX_INT8_FILE},
+        )
+        return PretokenizedCrossEncoder(model)
 
     def _release_accelerator_memory(self) -> None:
         """Best-effort release of Python and torch GPU caches."""
@@ -215,11 +414,11 @@ class CrossEncoderReranker:
         except Exception:  # noqa: BLE001
             pass
 
-    def _normalize_scores(self, raw_scores: object, expected_count: int) -> list[float]:
-        """Normalize score payload into a float list with strict length check."""
+    def _normalize_scores(self, raw_scores: object, expected_count: int) -> np.ndarray:
+        """Normalize score payload into a flat float32 array with strict length check."""
 
         try:
-            scores = np.asarray(raw_scores, dtype=float).reshape(-1)
+            scores = np.ascontiguousarray(raw_scores, dtype=np.float32).reshape(-1)
         except Exception as error:  # noqa: BLE001
             raise ExternalServiceError("Cross-encoder returned malformed score payload") from error
 
@@ -229,7 +428,7 @@ class CrossEncoderReranker:
                 f"expected={expected_count} got={scores.size}"
             )
 
-        return [float(item) for item in scores.tolist()]
+        return scores
 
     def _resolve_device(self, configured_device: str) -> str:
         """Resolve auto/cuda/cpu preference at runtime."""
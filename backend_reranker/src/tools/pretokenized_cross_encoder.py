@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from sentence_transformers import CrossEncoder
+
+_PRETOKENIZE_MIN_DOCUMENTS = 8
+_CUDA_GRAPH_MIN_LENGTH = 64
+
+logger = logging.getLogger(__name__)
+
+
+def truncate_pair_lengths(query_length: int, document_length: int, budget: int) -> tuple[int, int]:
+    """Split a pair token budget the way the tokenizer's longest-first truncation does."""
+
+    # Longest-first trims the longer side first, so the longer side keeps the odd token when both overflow.
+    half = (budget + 1) // 2
+    if query_length > document_length:
+        query_keep = min(query_length, max(budget - document_length, half))
+        return query_keep, min(document_length, budget - query_keep)
+
+    document_keep = min(document_length, max(budget - query_length, half))
+    return min(query_length, budget - document_keep), document_keep
+
+
+class _CudaGraphForward:
+    """Replays CUDA graphs of the classifier forward, captured once per (batch size, sequence length) shape."""
+
+    def __init__(self, module: Any) -> None:
+        import torch
+
+        self._module = module
+        self._pool = torch.cuda.graph_pool_handle()
+        self._graphs: dict[tuple[int, int], tuple[Any, dict[str, Any], Any]] = {}
+        # Captured graphs share static buffers and one memory pool, so replays must not overlap.
+        self._lock = threading.Lock()
+
+    def capture(self, inputs: dict[str, Any]) -> None:
+        """Capture the forward pass for the shape of ``inputs``; call before the model serves requests."""
+
+        shape = tuple(inputs["input_ids"].shape)
+        with self._lock:
+            if shape not in self._graphs:
+                self._graphs[shape] = self._capture(inputs)
+
+    def __call__(self, inputs: dict[str, Any]) -> Any | None:
+        """Replay the captured graph for this input shape, or return None when that shape was never captured."""
+
+        captured = self._graphs.get(tuple(inputs["input_ids"].shape))
+        if captured is None:
+            return None
+
+        graph, static_inputs, static_logits = captured
+        with self._lock:
+            for name, tensor in inputs.items():
+                static_inputs[name].copy_(tensor)
+            graph.replay()
+            return static_logits.clone()
+
+    def _capture(self, inputs: dict[str, Any]) -> tuple[Any, dict[str, Any], Any]:
+        """Warm up on a side stream, then capture the forward pass for this input shape."""
+
+        import torch
+
+        static_inputs = {name: tensor.clone() for name, tensor in inputs.items()}
+        side_stream = torch.cuda.Stream()
+        side_stream.wait_stream(torch.cuda.current_stream())
+        with torch.inference_mode(), torch.cuda.stream(side_stream):
+            for _ in range(2):
+                self._module(**static_inputs, return_dict=True)
+        torch.cuda.current_stream().wait_stream(side_stream)
+
+        graph = torch.cuda.CUDAGraph()
+        # Other models may run eager forwards on worker threads meanwhile; only this thread's calls must be capturable.
+        with torch.inference_mode(), torch.cuda.graph(graph, pool=self._pool, capture_error_mode="thread_local"):
+            static_logits = self._module(**static_inputs, return_dict=True).logits
+        return graph, static_inputs, static_logits
+
+
+class PretokenizedCrossEncoder:
+    """CrossEncoder wrapper that tokenizes the shared query once per rerank call."""
+
+    def __init__(
+        self,
+        model: CrossEncoder,
+        min_documents: int = _PRETOKENIZE_MIN_DOCUMENTS,
+        cuda_graphs: bool = False,
+        graph_batch_size: int = 16,
+    ) -> None:
+        self._model = model
+        self._tokenizer = model.tokenizer
+        self._min_documents = min_documents
+        self._pair_budget = model.max_length - self._tokenizer.num_special_tokens_to_add(pair=True)
+        self._uses_token_types = "token_type_ids" in self._tokenizer.model_input_names
+        # Pairs are already token ids, so pad() is the right call; silence the fast-tokenizer pad advice.
+        self._tokenizer.deprecation_warnings["Asking-to-pad-a-fast-tokenizer"] = True
+        model.eval()
+        self._graph_forward: _CudaGraphForward | None = None
+        if cuda_graphs and model.model.device.type == "cuda":
+            self._graph_forward = self._capture_graph_forward(graph_batch_size)
+
+    def predict(
+        self,
+        sentences: Sequence[tuple[str, str]],
+        batch_size: int = 16,
+        show_progress_bar: bool = False,
+    ) -> object:
+        """Score arbitrary sentence pairs through the wrapped CrossEncoder."""
+
+        return self._model.predict(sentences, batch_size, show_progress_bar)
+
+    def predict_query(self, query: str, documents: Sequence[str], batch_size: int) -> object:
+        """Score one query against many documents, tokenizing the query only once."""
+
+        if len(documents) < self._min_documents:
+            return self.predict([(query, document) for document in documents], batch_size, False)
+
+        import torch
+
+        tokenizer = self._tokenizer
+        budget = self._pair_budget
+        query_ids = tokenizer(query, add_special_tokens=False, truncation=True, max_length=budget)["input_ids"]
+        document_ids = tokenizer(
+            list(documents),
+            add_special_tokens=False,
+            truncation=True,
+            max_length=budget,
+        )["input_ids"]
+        features = [self._build_pair_features(query_ids, ids) for ids in document_ids]
+
+        # Batch pairs in length order so each batch pads to a similar length, then restore input order.
+        lengths = np.fromiter((len(item["input_ids"]) for item in features), dtype=np.int64, count=len(features))
+        order = np.argsort(lengths, kind="stable")
+
+        model = self._model
+        device = model.model.device
+        batch_scores = []
+        with torch.inference_mode():
+            for start in range(0, len(order), batch_size):
+                batch_features = [features[index] for index in order[start : start + batch_size]]
+                logits = None
+                if self._graph_forward is not None and len(batch_features) == batch_size:
+                    # Pad full batches to a power-of-two length bucket so the graphs captured at load cover them.
+                    batch = tokenizer.pad(
+                        batch_features,
+                        padding="max_length",
+                        max_length=self._graph_sequence_length(len(batch_features[-1]["input_ids"])),
+                        return_tensors="pt",
+                    ).to(device)
+                    logits = self._graph_forward(dict(batch))
+                if logits is None:
+                    batch = tokenizer.pad(batch_features, return_tensors="pt").to(device)
+                    logits = model.model(**batch, return_dict=True).logits
+                logits = model.activation_fn(logits)
+                batch_scores.append(logits.float().cpu())
+
+        sorted_scores = torch.cat(batch_scores).numpy()
+        scores = np.empty_like(sorted_scores)
+        scores[order] = sorted_scores
+        return scores[:, 0] if scores.shape[1] == 1 else scores
+
+    def _capture_graph_forward(self, batch_size: int) -> _CudaGraphForward | None:
+        """Capture one graph per sequence-length bucket for full batches of ``batch_size`` pairs.
+
+        A failed capture leaves its bucket and every longer one to the eager forward, since a bucket that runs out of
+        memory or hits an uncapturable op would fail the same way at greater lengths. Returns None when nothing was
+        captured.
+        """
+
+        import torch
+
+        graph_forward = _CudaGraphForward(self._model.model)
+        lengths = sorted({self._graph_sequence_length(length) for length in range(1, self._model.max_length + 1)})
+        device = self._model.model.device
+        for length in lengths:
+            inputs = {
+                "input_ids": torch.full(
+                    (batch_size, length),
+                    self._tokenizer.pad_token_id,
+                    dtype=torch.long,
+                    device=device,
+                ),
+                "attention_mask": torch.ones((batch_size, length), dtype=torch.long, device=device),
+            }
+            if self._uses_token_types:
+                inputs["token_type_ids"] = torch.zeros((batch_size, length), dtype=torch.long, device=device)
+            try:
+                graph_forward.capture(inputs)
+            except Exception as error:  # noqa: BLE001
+                logger.warning(
+                    "CUDA graph capture failed; using the eager forward from this length on. "
+                    "batch_size=%s length=%s error=%s",
+                    batch_size,
+                    length,
+                    error,
+                )
+                return graph_forward if length != lengths[0] else None
+
+        return graph_forward
+
+    def _graph_sequence_length(self, longest: int) -> int:
+        """Round a batch's longest sequence up to its captured-graph length bucket."""
+
+        return min(self._model.max_length, max(_CUDA_GRAPH_MIN_LENGTH, 1 << (longest - 1).bit_length()))
+
+    def _build_pair_features(self, query_ids: list[int], document_ids: list[int]) -> dict[str, Any]:
+        """Build special-token-wrapped pair inputs from pre-tokenized query and document ids."""
+
+        query_keep, document_keep = truncate_pair_lengths(len(query_ids), len(document_ids), self._pair_budget)
+        query_part = query_ids[:query_keep]
+        document_part = document_ids[:document_keep]
+
+        features: dict[str, Any] = {
+            "input_ids": self._tokenizer.build_inputs_with_special_tokens(query_part, document_part)
+        }
+        if self._uses_token_types:
+            features["token_type_ids"] = self._tokenizer.create_token_type_ids_from_sequences(
+                query_part,
+                document_part,
+            )
+        return features
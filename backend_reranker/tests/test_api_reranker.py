@@ -1,10 +1,25 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Sequence
 
 os.environ["RERANK_DEVICE"] = "cpu"
 
+from fastapi.testclient import TestClient
+
 from src.main import app
+from src.services.rerank_service import RerankService
+from src.tools.cross_encoder_reranker import CrossEncoderReranker
+
+
+class _FakeModel:
+    def predict(  # noqa: ARG002
+        self,
+        sentences: Sequence[tuple[str, str]],
+        batch_size: int = 16,
+        show_progress_bar: bool = False,
+    ) -> list[float]:
+        return [(index + 1) / len(sentences) for index in range(len(sentences))]
 
 
 def test_openapi_contains_rerank_routes() -> None:
@@ -13,3 +28,53 @@ def test_openapi_contains_rerank_routes() -> None:
 
     assert "/v1/health" in paths
     assert "/v1/rerank" in paths
+    assert paths["/v1/rerank"]["post"]["responses"]["200"]["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/RerankResponse"
+    }
+
+
+def _build_client() -> TestClient:
+    app.state.rerank_service = RerankService(
+        reranker=CrossEncoderReranker(
+            default_model="BAAI/bge-reranker-v2-m3",
+            configured_device="cpu",
+            max_length=512,
+            batch_size=8,
+            use_fp16=False,
+            model_loader=lambda *_: _FakeModel(),
+        )
+    )
+    return TestClient(app)
+
+
+def test_rerank_route_returns_serialized_rows() -> None:
+    response = _build_client().post(
+        "/v1/rerank",
+        json={"model": "bge-reranker-v2-m3", "query": "gift", "documents": ["doc a", "doc b"]},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "model": "bge-reranker-v2-m3",
+        "resolved_model": "BAAI/bge-reranker-v2-m3",
+        "results": [
+            {"index": 1, "relevance_score": 1.0},
+            {"index": 0, "relevance_score": 0.5},
+        ],
+    }
+    assert "content-encoding" not in response.headers
+
+
+def test_rerank_route_compresses_large_payloads() -> None:
+    documents = [f"doc {index}" for index in range(100)]
+
+    response = _build_client().post(
+        "/v1/rerank",
+        json={"model": "bge-reranker-v2-m3", "query": "gift", "documents": documents},
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["results"]) == 100
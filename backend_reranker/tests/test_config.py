@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import pytest
+
+from src.core.config import load_settings
+
+
+def test_load_settings_is_cached_until_cleared(monkeypatch: pytest.MonkeyPatch) -> None:
+    load_settings.cache_clear()
+    monkeypatch.setenv("RERANK_BATCH_SIZE", "4")
+    first = load_settings()
+    monkeypatch.setenv("RERANK_BATCH_SIZE", "32")
+
+    assert load_settings() is first
+    assert first.rerank_batch_size == 4
+
+    load_settings.cache_clear()
+    assert load_settings().rerank_batch_size == 32
+    load_settings.cache_clear()
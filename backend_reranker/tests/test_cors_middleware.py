@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.core.cors import CORSFastMiddleware
+
+_ALLOWED_ORIGIN = "http://localhost:5173"
+
+
+def _build_client() -> TestClient:
+    app = FastAPI()
+
+    @app.post("/echo")
+    def echo() -> dict[str, str]:
+        return {"status": "ok"}
+
+    app.add_middleware(CORSFastMiddleware, allow_origins=[_ALLOWED_ORIGIN])
+    return TestClient(app)
+
+
+def test_cors_preflight_is_answered_without_entering_the_app() -> None:
+    response = _build_client().options(
+        "/echo",
+        headers={
+            "Origin": _ALLOWED_ORIGIN,
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type",
+        },
+    )
+
+    assert response.status_code == 204
+    assert response.headers["access-control-allow-origin"] == _ALLOWED_ORIGIN
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers["access-control-allow-headers"] == "content-type"
+    assert "POST" in response.headers["access-control-allow-methods"]
+
+
+def test_cors_preflight_rejects_unknown_origin() -> None:
+    response = _build_client().options(
+        "/echo",
+        headers={"Origin": "http://evil.example", "Access-Control-Request-Method": "POST"},
+    )
+
+    assert response.status_code == 400
+    assert "access-control-allow-origin" not in response.headers
+
+
+def test_cors_headers_are_added_only_for_allowed_origins() -> None:
+    client = _build_client()
+
+    allowed = client.post("/echo", headers={"Origin": _ALLOWED_ORIGIN})
+    unknown = client.post("/echo", headers={"Origin": "http://evil.example"})
+
+    assert allowed.json() == {"status": "ok"}
+    assert allowed.headers["access-control-allow-origin"] == _ALLOWED_ORIGIN
+    assert allowed.headers["vary"] == "Origin"
+    assert unknown.status_code == 200
+    assert "access-control-allow-origin" not in unknown.headers
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 
+import pytest
+
+from src.core.exceptions import ExternalServiceError
 from src.tools.cross_encoder_reranker import CrossEncoderReranker
 
 
@@ -54,7 +61,7 @@ def test_cross_encoder_tool_tracks_loaded_models() -> None:
     assert tool.loaded_models() == []
 
 
-def test_cross_encoder_tool_unloads_after_request_by_default() -> None:
+def test_cross_encoder_tool_keeps_model_loaded_after_request() -> None:
     tool = CrossEncoderReranker(
         default_model="BAAI/bge-reranker-v2-m3",
         configured_device="cpu",
@@ -71,17 +78,18 @@ def test_cross_encoder_tool_unloads_after_request_by_default() -> None:
         top_n=1,
     )
 
-    assert tool.loaded_models() == []
+    assert tool.loaded_models() == ["BAAI/bge-reranker-v2-m3"]
+    assert tool.unload_idle_models(max_idle_seconds=3600) == []
+    assert tool.loaded_models() == ["BAAI/bge-reranker-v2-m3"]
 
 
-def test_cross_encoder_tool_can_keep_model_loaded_when_configured() -> None:
+def test_cross_encoder_tool_unloads_idle_models() -> None:
     tool = CrossEncoderReranker(
         default_model="BAAI/bge-reranker-v2-m3",
         configured_device="cpu",
         max_length=512,
         batch_size=8,
         use_fp16=False,
-        unload_after_request=False,
         model_loader=_fake_loader,
     )
 
@@ -92,4 +100,480 @@ def test_cross_encoder_tool_can_keep_model_loaded_when_configured() -> None:
         top_n=1,
     )
 
+    assert tool.unload_idle_models(max_idle_seconds=0) == ["BAAI/bge-reranker-v2-m3"]
+    assert tool.loaded_models() == []
+
+
+def test_cross_encoder_tool_idle_sweep_skips_models_in_use() -> None:
+    swept: list[list[str]] = []
+
+    class _SweepingModel(_FakeModel):
+        def predict(  # noqa: ARG002
+            self,
+            sentences: Sequence[tuple[str, str]],
+            batch_size: int = 16,
+            show_progress_bar: bool = False,
+        ) -> list[float]:
+            swept.append(tool.unload_idle_models(max_idle_seconds=0))
+            return super().predict(sentences, batch_size, show_progress_bar)
+
+    tool = CrossEncoderReranker(
+        default_model="BAAI/bge-reranker-v2-m3",
+        configured_device="cpu",
+        max_length=512,
+        batch_size=8,
+        use_fp16=False,
+        model_loader=lambda *_: _SweepingModel(),
+    )
+
+    tool.rerank(
+        model="BAAI/bge-reranker-v2-m3",
+        query="gift",
+        documents=["doc a", "doc b"],
+        top_n=1,
+    )
+
+    assert swept == [[]]
     assert tool.loaded_models() == ["BAAI/bge-reranker-v2-m3"]
+    assert tool.unload_idle_models(max_idle_seconds=0) == ["BAAI/bge-reranker-v2-m3"]
+
+
+def test_cross_encoder_tool_ranks_all_documents_without_top_n() -> None:
+    tool = CrossEncoderReranker(
+        default_model="BAAI/bge-reranker-v2-m3",
+        configured_device="cpu",
+        max_length=512,
+        batch_size=8,
+        use_fp16=False,
+        model_loader=_fake_loader,
+    )
+
+    result = tool.rerank(
+        model="BAAI/bge-reranker-v2-m3",
+        query="gift",
+        documents=["doc0", "doc1", "doc2"],
+        top_n=None,
+    )
+
+    assert [row.index for row in result.results] == [1, 2, 0]
+    assert all(type(row.index) is int and type(row.relevance_score) is float for row in result.results)
+    assert result.results[0].relevance_score == pytest.approx(0.95)
+
+
+def test_cross_encoder_tool_keeps_input_order_for_tied_scores() -> None:
+    class _TiedModel:
+        def predict(  # noqa: ARG002
+            self,
+            sentences: Sequence[tuple[str, str]],
+            batch_size: int = 16,
+            show_progress_bar: bool = False,
+        ) -> list[float]:
+            return [0.5, 0.9, 0.5, 0.5][: len(sentences)]
+
+    tool = CrossEncoderReranker(
+        default_model="BAAI/bge-reranker-v2-m3",
+        configured_device="cpu",
+        max_length=512,
+        batch_size=8,
+        use_fp16=False,
+        model_loader=lambda *_: _TiedModel(),
+    )
+
+    result = tool.rerank(
+        model="BAAI/bge-reranker-v2-m3",
+        query="gift",
+        documents=["doc0", "doc1", "doc2", "doc3"],
+        top_n=4,
+    )
+
+    assert [row.index for row in result.results] == [1, 0, 2, 3]
+
+
+def test_cross_encoder_tool_keeps_input_order_for_tied_scores_at_top_n_cutoff() -> None:
+    class _TiedModel:
+        def predict(  # noqa: ARG002
+            self,
+            sentences: Sequence[tuple[str, str]],
+            batch_size: int = 16,
+            show_progress_bar: bool = False,
+        ) -> list[float]:
+            return [0.5, 0.9, 0.5, 0.1, 0.5, 0.5][: len(sentences)]
+
+    tool = CrossEncoderReranker(
+        default_model="BAAI/bge-reranker-v2-m3",
+        configured_device="cpu",
+        max_length=512,
+        batch_size=8,
+        use_fp16=False,
+        model_loader=lambda *_: _TiedModel(),
+    )
+
+    result = tool.rerank(
+        model="BAAI/bge-reranker-v2-m3",
+        query="gift",
+        documents=[f"doc{index}" for index in range(6)],
+        top_n=3,
+    )
+
+    assert [row.index for row in result.results] == [1, 0, 2]
+
+
+def test_cross_encoder_tool_evicts_least_recently_used_model() -> None:
+    tool = CrossEncoderReranker(
+        default_model="BAAI/bge-reranker-v2-m3",
+        configured_device="cpu",
+        max_length=512,
+        batch_size=8,
+        use_fp16=False,
+        max_cached_models=2,
+        model_loader=_fake_loader,
+    )
+
+    for model in ("model-a", "model-b", "model-a", "model-c"):
+        tool.rerank(model=model, query="gift", documents=["doc a", "doc b"], top_n=1)
+
+    assert tool.loaded_models() == ["model-a", "model-c"]
+
+
+def test_cross_encoder_tool_eviction_skips_models_in_use() -> None:
+    predicting = threading.Event()
+    finish_predict = threading.Event()
+
+    class _BlockingModel(_FakeModel):
+        def predict(  # noqa: ARG002
+            self,
+            sentences: Sequence[tuple[str, str]],
+            batch_size: int = 16,
+            show_progress_bar: bool = False,
+        ) -> list[float]:
+            predicting.set()
+            assert finish_predict.wait(timeout=5)
+            return super().predict(sentences, batch_size, show_progress_bar)
+
+    def _loader(model_name: str, *_: object) -> _FakeModel:
+        return _BlockingModel() if model_name == "busy-model" else _FakeModel()
+
+    tool = CrossEncoderReranker(
+        default_model="model-a",
+        configured_device="cpu",
+        max_length=512,
+        batch_size=8,
+        use_fp16=False,
+        max_cached_models=2,
+        model_loader=_loader,
+    )
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        busy = executor.submit(tool.rerank, model="busy-model", query="gift", documents=["doc a"], top_n=1)
+        assert predicting.wait(timeout=5)
+
+        tool.rerank(model="model-a", query="gift", documents=["doc a"], top_n=1)
+        tool.rerank(model="model-b", query="gift", documents=["doc a"], top_n=1)
+        assert tool.loaded_models() == ["busy-model", "model-b"]
+
+        finish_predict.set()
+        busy.result(timeout=5)
+
+    assert tool.loaded_models() == ["busy-model", "model-b"]
+
+
+def test_cross_encoder_tool_exceeds_cache_limit_only_while_every_model_is_in_use() -> None:
+    predicting = threading.Event()
+    finish_predict = threading.Event()
+    loaded_during_predict: list[list[str]] = []
+
+    class _BlockingModel(_FakeModel):
+        def predict(  # noqa: ARG002
+            self,
+            sentences: Sequence[tuple[str, str]],
+            batch_size: int = 16,
+            show_progress_bar: bool = False,
+        ) -> list[float]:
+            predicting.set()
+            assert finish_predict.wait(timeout=5)
+            return super().predict(sentences, batch_size, show_progress_bar)
+
+    class _RecordingModel(_FakeModel):
+        def predict(  # noqa: ARG002
+            self,
+            sentences: Sequence[tuple[str, str]],
+            batch_size: int = 16,
+            show_progress_bar: bool = False,
+        ) -> list[float]:
+            loaded_during_predict.append(tool.loaded_models())
+            return super().predict(sentences, batch_size, show_progress_bar)
+
+    def _loader(model_name: str, *_: object) -> _FakeModel:
+        return _BlockingModel() if model_name == "busy-model" else _RecordingModel()
+
+    tool = CrossEncoderReranker(
+        default_model="model-a",
+        configured_device="cpu",
+        max_length=512,
+        batch_size=8,
+        use_fp16=False,
+        max_cached_models=1,
+        model_loader=_loader,
+    )
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        busy = executor.submit(tool.rerank, model="busy-model", query="gift", documents=["doc a"], top_n=1)
+        assert predicting.wait(timeout=5)
+
+        tool.rerank(model="model-a", query="gift", documents=["doc a"], top_n=1)
+        assert tool.loaded_models() == ["busy-model"]
+
+        finish_predict.set()
+        busy.result(timeout=5)
+
+    assert loaded_during_predict == [["busy-model", "model-a"]]
+    assert tool.loaded_models() == ["busy-model"]
+
+
+def test_cross_encoder_tool_failed_load_keeps_warm_models() -> None:
+    def _loader(model_name: str, *_: object) -> _FakeModel:
+        if model_name == "missing-model":
+            raise OSError("not found")
+        return _FakeModel()
+
+    tool = CrossEncoderReranker(
+        default_model="model-a",
+        configured_device="cpu",
+        max_length=512,
+        batch_size=8,
+        use_fp16=False,
+        max_cached_models=1,
+        model_loader=_loader,
+    )
+
+    tool.rerank(model="model-a", query="gift", documents=["doc a"], top_n=1)
+    with pytest.raises(ExternalServiceError):
+        tool.rerank(model="missing-model", query="gift", documents=["doc a"], top_n=1)
+
+    assert tool.loaded_models() == ["model-a"]
+
+
+def test_cross_encoder_tool_retries_after_a_failed_load_with_a_single_load() -> None:
+    load_calls: list[str] = []
+    load_started = [threading.Event(), threading.Event()]
+    finish_load = [threading.Event(), threading.Event()]
+
+    def _loader(model_name: str, *_: object) -> _FakeModel:
+        attempt = len(load_calls)
+        load_calls.append(model_name)
+        load_started[attempt].set()
+        assert finish_load[attempt].wait(timeout=5)
+        if attempt == 0:
+            raise OSError("transient download failure")
+        return _FakeModel()
+
+    def _wait_for_load_lock_users(count: int) -> None:
+        deadline = time.monotonic() + 5
+        while tool._load_lock_users.get("model-a", 0) != count:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+
+    tool = CrossEncoderReranker(
+        default_model="model-a",
+        configured_device="cpu",
+        max_length=512,
+        batch_size=8,
+        use_fp16=False,
+        model_loader=_loader,
+    )
+
+    def _rerank() -> object:
+        return tool.rerank(model="model-a", query="gift", documents=["doc a"], top_n=1)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        first = executor.submit(_rerank)
+        assert load_started[0].wait(timeout=5)
+        waiting = executor.submit(_rerank)
+        _wait_for_load_lock_users(2)
+
+        finish_load[0].set()
+        assert load_started[1].wait(timeout=5)
+        late = executor.submit(_rerank)
+        _wait_for_load_lock_users(2)
+
+        finish_load[1].set()
+        with pytest.raises(ExternalServiceError):
+            first.result(timeout=5)
+        waiting.result(timeout=5)
+        late.result(timeout=5)
+
+    assert load_calls == ["model-a", "model-a"]
+    assert tool._load_locks == {}
+    assert tool._load_lock_users == {}
+
+
+def test_cross_encoder_tool_serves_cached_models_during_a_cold_load() -> None:
+    slow_load_started = threading.Event()
+    release_slow_load = threading.Event()
+
+    def _loader(model_name: str, *_: object) -> _FakeModel:
+        if model_name == "slow-model":
+            slow_load_started.set()
+            assert release_slow_load.wait(timeout=5)
+        return _FakeModel()
+
+    tool = CrossEncoderReranker(
+        default_model="fast-model",
+        configured_device="cpu",
+        max_length=512,
+        batch_size=8,
+        use_fp16=False,
+        model_loader=_loader,
+    )
+    tool.rerank(model="fast-model", query="gift", documents=["doc a"], top_n=1)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        slow = executor.submit(tool.rerank, model="slow-model", query="gift", documents=["doc a"], top_n=1)
+        assert slow_load_started.wait(timeout=5)
+
+        fast = tool.rerank(model="fast-model", query="gift", documents=["doc a"], top_n=1)
+        release_slow_load.set()
+        slow.result(timeout=5)
+
+    assert fast.resolved_model == "fast-model"
+    assert tool.loaded_models() == ["fast-model", "slow-model"]
+
+
+def test_cross_encoder_tool_loads_different_models_concurrently() -> None:
+    loading = {"model-a": threading.Event(), "model-b": threading.Event()}
+
+    def _loader(model_name: str, *_: object) -> _FakeModel:
+        loading[model_name].set()
+        other = "model-b" if model_name == "model-a" else "model-a"
+        assert loading[other].wait(timeout=5)
+        return _FakeModel()
+
+    tool = CrossEncoderReranker(
+        default_model="model-a",
+        configured_device="cpu",
+        max_length=512,
+        batch_size=8,
+        use_fp16=False,
+        model_loader=_loader,
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(tool.rerank, model=model, query="gift", documents=["doc a"], top_n=1)
+            for model in ("model-a", "model-b")
+        ]
+        for future in futures:
+            future.result(timeout=10)
+
+    assert tool.loaded_models() == ["model-a", "model-b"]
+    assert tool._load_locks == {}
+
+
+async def test_cross_encoder_tool_async_rerank_loads_model_once() -> None:
+    loads: list[str] = []
+
+    def counting_loader(model_name: str, device: str, max_length: int, use_fp16: bool) -> _FakeModel:
+        loads.append(model_name)
+        return _fake_loader(model_name, device, max_length, use_fp16)
+
+    tool = CrossEncoderReranker(
+        default_model="BAAI/bge-reranker-v2-m3",
+        configured_device="cpu",
+        max_length=512,
+        batch_size=8,
+        use_fp16=False,
+        model_loader=counting_loader,
+    )
+
+    results = await asyncio.gather(
+        *(
+            tool.arerank(model="BAAI/bge-reranker-v2-m3", query="gift", documents=["d0", "d1", "d2"], top_n=2)
+            for _ in range(4)
+        )
+    )
+
+    assert loads == ["BAAI/bge-reranker-v2-m3"]
+    assert all([row.index for row in result.results] == [1, 2] for result in results)
+
+
+async def test_cross_encoder_tool_async_rerank_loads_different_models_concurrently() -> None:
+    loading = {"model-a": threading.Event(), "model-b": threading.Event()}
+
+    def _loader(model_name: str, *_: object) -> _FakeModel:
+        loading[model_name].set()
+        other = "model-b" if model_name == "model-a" else "model-a"
+        assert loading[other].wait(timeout=5)
+        return _FakeModel()
+
+    tool = CrossEncoderReranker(
+        default_model="model-a",
+        configured_device="cpu",
+        max_length=512,
+        batch_size=8,
+        use_fp16=False,
+        model_loader=_loader,
+    )
+
+    await asyncio.gather(
+        *(tool.arerank(model=model, query="gift", documents=["doc a"], top_n=1) for model in ("model-a", "model-b"))
+    )
+
+    assert tool.loaded_models() == ["model-a", "model-b"]
+    assert tool._pending_loads == {}
+
+
+async def test_cross_encoder_tool_async_failed_load_leaves_no_model_state() -> None:
+    def _failing_loader(*_: object) -> _FakeModel:
+        raise OSError("not found")
+
+    tool = CrossEncoderReranker(
+        default_model="BAAI/bge-reranker-v2-m3",
+        configured_device="cpu",
+        max_length=512,
+        batch_size=8,
+        use_fp16=False,
+        model_loader=_failing_loader,
+    )
+
+    for attempt in range(3):
+        with pytest.raises(ExternalServiceError):
+            await tool.arerank(model=f"missing-{attempt}", query="gift", documents=["doc a"], top_n=1)
+
+    assert tool.loaded_models() == []
+    assert tool._last_used == {}
+    assert tool._pending_loads == {}
+    assert tool._load_locks == {}
+
+
+def test_cross_encoder_tool_resolves_blank_model_to_default() -> None:
+    tool = CrossEncoderReranker(
+        default_model="bge-reranker-v2-m3:latest",
+        configured_device="cpu",
+        max_length=512,
+        batch_size=8,
+        use_fp16=False,
+        model_loader=_fake_loader,
+    )
+
+    assert tool.resolve_model_name("   ") == "BAAI/bge-reranker-v2-m3"
+    assert tool.resolve_model_name(" custom/model ") == "custom/model"
+
+
+def test_cross_encoder_tool_releases_memory_once_per_idle_sweep(monkeypatch: pytest.MonkeyPatch) -> None:
+    tool = CrossEncoderReranker(
+        default_model="BAAI/bge-reranker-v2-m3",
+        configured_device="cpu",
+        max_length=512,
+        batch_size=8,
+        use_fp16=False,
+        model_loader=_fake_loader,
+    )
+    releases: list[None] = []
+    monkeypatch.setattr(tool, "_release_accelerator_memory", lambda: releases.append(None))
+
+    for model in ("model-a", "model-b"):
+        tool.rerank(model=model, query="gift", documents=["doc a", "doc b"], top_n=1)
+
+    assert releases == []
+    assert tool.unload_idle_models(max_idle_seconds=0) == ["model-a", "model-b"]
+    assert len(releases) == 1
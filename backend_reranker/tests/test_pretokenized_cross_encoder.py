@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.tools.cross_encoder_reranker import CrossEncoderReranker
+from src.tools.pretokenized_cross_encoder import PretokenizedCrossEncoder, _CudaGraphForward, truncate_pair_lengths
+
+_VOCAB = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", *"abcdefghijklmnopqrstuvwxyz"]
+
+
+@pytest.fixture(scope="module")
+def tiny_model_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Randomly initialised BERT cross-encoder checkpoint small enough to build offline."""
+
+    pytest.importorskip("torch")
+    transformers = pytest.importorskip("transformers")
+
+    model_dir = tmp_path_factory.mktemp("tiny-cross-encoder")
+    (model_dir / "vocab.txt").write_text("\n".join(_VOCAB), encoding="utf-8")
+    transformers.BertTokenizerFast(vocab_file=str(model_dir / "vocab.txt")).save_pretrained(model_dir)
+    config = transformers.BertConfig(
+        vocab_size=len(_VOCAB),
+        hidden_size=16,
+        num_hidden_layers=1,
+        num_attention_heads=2,
+        intermediate_size=32,
+        num_labels=1,
+    )
+    transformers.BertForSequenceClassification(config).save_pretrained(model_dir)
+    return model_dir
+
+
+@pytest.fixture(scope="module")
+def tiny_cross_encoder(tiny_model_dir: Path) -> object:
+    sentence_transformers = pytest.importorskip("sentence_transformers")
+    return sentence_transformers.CrossEncoder(str(tiny_model_dir), device="cpu", max_length=24)
+
+
+@pytest.mark.parametrize(
+    ("query_length", "document_length", "budget", "expected"),
+    [
+        (3, 5, 20, (3, 5)),
+        (3, 40, 20, (3, 17)),
+        (40, 4, 20, (16, 4)),
+        (40, 40, 20, (10, 10)),
+        (12, 11, 21, (11, 10)),
+        (11, 14, 21, (10, 11)),
+    ],
+)
+def test_truncate_pair_lengths_matches_longest_first(
+    query_length: int,
+    document_length: int,
+    budget: int,
+    expected: tuple[int, int],
+) -> None:
+    assert truncate_pair_lengths(query_length, document_length, budget) == expected
+
+
+@pytest.mark.parametrize("cuda_graphs", [False, True], ids=["eager", "cuda-graphs-requested"])
+def test_predict_query_matches_pairwise_predict_in_input_order(tiny_cross_encoder: object, cuda_graphs: bool) -> None:
+    # Off-GPU a CUDA graph request falls back to the eager forward.
+    encoder = PretokenizedCrossEncoder(tiny_cross_encoder, min_documents=1, cuda_graphs=cuda_graphs)
+    query = "a b c d e f g h i j k l m"
+    documents = ["d e f", "a", "g h i j k l m n o p q r s t u v w x y z a b c d e f", "c b a"]
+
+    expected = tiny_cross_encoder.predict([(query, document) for document in documents], batch_size=2)
+    actual = encoder.predict_query(query, documents, batch_size=3)
+
+    np.testing.assert_allclose(actual, expected, rtol=1e-5, atol=1e-6)
+
+
+def test_failed_graph_capture_falls_back_to_eager_forward(
+    tiny_cross_encoder: object,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    def _failing_capture(self: _CudaGraphForward, inputs: dict[str, object]) -> None:  # noqa: ARG001
+        raise RuntimeError("CUDA out of memory")
+
+    torch = pytest.importorskip("torch")
+    monkeypatch.setattr(torch.cuda, "graph_pool_handle", lambda: None)
+    monkeypatch.setattr(_CudaGraphForward, "_capture", _failing_capture)
+    encoder = PretokenizedCrossEncoder(tiny_cross_encoder, min_documents=1)
+    query = "a b c"
+    documents = ["d e f", "a", "c b a"]
+
+    with caplog.at_level("WARNING"):
+        encoder._graph_forward = encoder._capture_graph_forward(batch_size=3)
+
+    expected = tiny_cross_encoder.predict([(query, document) for document in documents])
+    actual = encoder.predict_query(query, documents, batch_size=3)
+
+    assert encoder._graph_forward is None
+    assert len(caplog.records) == 1
+    np.testing.assert_allclose(actual, expected, rtol=1e-5, atol=1e-6)
+
+
+def test_onnx_int8_runtime_quantizes_once_and_tracks_torch_scores(
+    tiny_model_dir: Path,
+    tiny_cross_encoder: object,
+    tmp_path: Path,
+) -> None:
+    pytest.importorskip("optimum.onnxruntime")
+    query = "a b c"
+    documents = ["d e f", "a", "c b a", "a b c d", "x y z", "q", "a c", "b", "m n o p"]
+
+    def build_tool() -> CrossEncoderReranker:
+        return CrossEncoderReranker(
+            default_model=str(tiny_model_dir),
+            configured_device="auto",
+            max_length=24,
+            batch_size=4,
+            use_fp16=False,
+            runtime="onnx-int8",
+            onnx_cache_dir=str(tmp_path),
+        )
+
+    first = build_tool()
+    result = first.rerank(model=str(tiny_model_dir), query=query, documents=documents, top_n=None)
+    quantized_files = sorted(tmp_path.rglob("*qint8*.onnx"))
+    build_tool().rerank(model=str(tiny_model_dir), query=query, documents=documents, top_n=1)
+
+    expected = tiny_cross_encoder.predict([(query, document) for document in documents])
+    actual = np.empty(len(documents), dtype=np.float32)
+    for row in result.results:
+        actual[row.index] = row.relevance_score
+
+    assert first.resolved_device == "cpu"
+    assert len(quantized_files) == 1
+    assert sorted(tmp_path.rglob("*qint8*.onnx")) == quantized_files
+    np.testing.assert_allclose(actual, expected, atol=0.05)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import pytest
 
 from src.core.exceptions import ValidationDomainError
-from src.models.api.rerank import RerankRequest
+from src.models.api.rerank import RerankRequest, RerankResponse
 from src.models.runtime.rerank import RerankResult, RerankRunResult
 from src.services.rerank_service import RerankService
 
@@ -62,3 +62,68 @@ def test_rerank_service_rejects_empty_documents() -> None:
                 documents=["   "],
             )
         )
+
+
+def test_rerank_service_response_serializes_without_revalidation() -> None:
+    service = RerankService(reranker=_StubReranker())
+
+    response = service.rerank(
+        RerankRequest(
+            model="bge-reranker-v2-m3:latest",
+            query="gift",
+            documents=["doc a", "doc b"],
+        )
+    )
+
+    assert RerankResponse.model_validate(response) is response
+    assert response.model_dump() == {
+        "model": "bge-reranker-v2-m3:latest",
+        "resolved_model": "BAAI/bge-reranker-v2-m3",
+        "results": [
+            {"index": 0, "relevance_score": 1.0},
+            {"index": 1, "relevance_score": 0.9},
+        ],
+    }
+
+
+def test_rerank_service_strips_and_drops_blank_documents() -> None:
+    class _RecordingReranker(_StubReranker):
+        documents: list[str] = []
+
+        def rerank(self, *, model: str, query: str, documents: list[str], top_n: int | None) -> RerankRunResult:
+            self.documents = documents
+            return super().rerank(model=model, query=query, documents=documents, top_n=top_n)
+
+    reranker = _RecordingReranker()
+    service = RerankService(reranker=reranker)
+
+    service.rerank(
+        RerankRequest(
+            model="BAAI/bge-reranker-v2-m3",
+            query=" gift ",
+            documents=["  doc a ", "", "   ", "doc b"],
+        )
+    )
+
+    assert reranker.documents == ["doc a", "doc b"]
+
+
+async def test_rerank_service_async_path_offloads_to_reranker() -> None:
+    class _AsyncStubReranker(_StubReranker):
+        async def arerank(self, *, model: str, query: str, documents: list[str], top_n: int | None) -> RerankRunResult:
+            return self.rerank(model=model, query=query, documents=documents, top_n=top_n)
+
+    service = RerankService(reranker=_AsyncStubReranker())
+
+    response = await service.arerank(
+        RerankRequest(model="BAAI/bge-reranker-v2-m3", query="gift", documents=["doc a", "doc b"], top_n=1)
+    )
+
+    assert [row.index for row in response.results] == [0]
+
+
+def test_rerank_request_strips_query_and_blank_documents() -> None:
+    request = RerankRequest(model="BAAI/bge-reranker-v2-m3", query=" gift ", documents=[" doc a ", "  ", "doc b"])
+
+    assert request.query == "gift"
+    assert request.documents == ["doc a", "doc b"]